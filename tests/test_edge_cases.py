@@ -17,6 +17,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from text_to_modento.core import (
     detect_multi_field_line,
     detect_inline_checkbox_with_text,
+    postprocess_order_sections,
+    detect_fill_in_blank_field,
 )
 
 
@@ -282,6 +284,35 @@ class TestCategoryHeadersInGrids:
         assert len(appearance_options) >= 1, f"Should have Appearance options, got {option_names}"
 
 
+class TestFillInBlankFields:
+    """Test standalone fill-in-blank field detection."""
+    
+    def test_label_underscore_is_kept(self):
+        """Only blank runs are stripped; an underscore inside the label stays."""
+        assert detect_fill_in_blank_field("________ ab_c") == ("ab_c", "ab_c")
+    
+    def test_short_underscore_run_is_not_stripped(self):
+        """Underscore runs shorter than a blank are part of the remaining text."""
+        assert detect_fill_in_blank_field("__ x ______") == ("x", "__ x")
+
+
+class TestSectionOrdering:
+    """Test section ordering of post-processed payloads."""
+    
+    def test_identical_fields_keep_their_positions(self):
+        """Equal field dicts should not be pulled together when sorting by section."""
+        dup = {"key": "comments", "title": "Comments", "section": "General", "type": "input"}
+        payload = [
+            dict(dup),
+            {"key": "notes", "title": "Notes", "section": "General", "type": "input"},
+            dict(dup),
+            {"key": "first_name", "title": "First Name", "section": "Patient Information", "type": "input"},
+        ]
+        result = postprocess_order_sections(payload)
+        
+        assert [f["key"] for f in result] == ["first_name", "comments", "notes", "comments"]
+
+
 # TestOCRAutoDetection class removed - OCR auto-detection feature not yet implemented
 # These tests were written for a planned feature that was never completed.
 # The Unstructured library already handles OCR automatically when needed via its strategies.
@@ -59,6 +59,7 @@ class TestPatch2FieldKeyValidation:
         assert is_valid_modento_key("patient.name") is False
         assert is_valid_modento_key("patient name") is False  # spaces not allowed
         assert is_valid_modento_key("patient/name") is False
+        assert is_valid_modento_key("patient_name\n") is False  # no trailing newline
     
     def test_invalid_starts_with_digit(self):
         """Test that keys starting with a digit fail validation"""
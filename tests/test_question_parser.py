@@ -173,6 +173,14 @@ class TestExtractCompoundYesNoPrompts:
         result = extract_compound_yn_prompts(line)
         # Should find at least one Yes/No pattern
         assert len(result) >= 1
+    
+    def test_extracts_question_with_uppercase_x_boxes(self):
+        """Checked boxes written as [X] should still delimit the Yes/No options."""
+        from text_to_modento import extract_compound_yn_prompts
+        
+        line = "Do you smoke? [X] Yes [X] No"
+        result = extract_compound_yn_prompts(line)
+        assert result == ["Do you smoke?"]
 
 
 class TestInlineCheckboxDetection:
@@ -296,6 +304,24 @@ class TestMultiFieldDetection:
                 assert len(title) > 0
 
 
+class TestYesNoOptions:
+    """Test the shared Yes/No option builder."""
+    
+    def test_matches_make_option(self):
+        """Should produce the same options as make_option for Yes/No."""
+        from text_to_modento.core import make_option, make_yes_no_options
+        
+        assert make_yes_no_options() == [make_option("Yes", True), make_option("No", False)]
+    
+    def test_returns_fresh_dicts(self):
+        """Each call returns new dicts, so callers can edit them in place."""
+        from text_to_modento.core import make_yes_no_options
+        
+        first = make_yes_no_options()
+        first[0]["name"] = "Changed"
+        assert make_yes_no_options()[0]["name"] == "Yes"
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, "-v"])
@@ -54,7 +54,8 @@ import json
 import re
 import sys
 from difflib import SequenceMatcher
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
+from operator import itemgetter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
@@ -112,6 +113,7 @@ from .modules.question_parser import (
     clean_option_text,
     clean_field_title,
     make_option,
+    make_yes_no_options,
     classify_input_type,
     classify_date_input,
     norm_title,  # Patch 2: Moved to question_parser for better organization
@@ -157,6 +159,7 @@ from .modules.ocr_correction import (
 # Performance Recommendations: Enhanced detection and consent handling
 from .modules.performance_enhancements import (
     detect_inline_checkbox_options,
+    infer_radio_vs_checkbox,
     enhance_field_type_detection,
     consolidate_procedural_consent_blocks,
     is_procedural_consent_text,
@@ -199,6 +202,24 @@ def get_template_catalog(path: Path) -> Optional[TemplateCatalog]:
 CHECKBOX_ANY = r"(?:\[\s*\]|\[x\]|☐|☑|□|■|❒|◻|✓|✔|✗|✘)"
 BULLET_RE = re.compile(r"^\s*(?:[-*•·]|" + CHECKBOX_ANY + r")\s+")
 CHECKBOX_MARK_RE = re.compile(r"^\s*(" + CHECKBOX_ANY + r")\s+")
+CHECKBOX_ANY_RE = re.compile(CHECKBOX_ANY)
+CHECKBOX_GLYPHS = "☐☑□■❒◻✓✔✗✘"
+
+
+def has_checkbox_token(s: str) -> bool:
+    """Membership-only equivalent of re.search(CHECKBOX_ANY, s), using str scans
+    and falling back to the regex only when a bracket is present."""
+    if "[" in s:
+        return CHECKBOX_ANY_RE.search(s) is not None
+    return any(g in s for g in CHECKBOX_GLYPHS)
+
+
+def starts_with_checkbox(s: str) -> bool:
+    """Prefix-test equivalent of re.match(r'^\\s*' + CHECKBOX_ANY, s)."""
+    s = s.lstrip()
+    if s.startswith("["):
+        return s.startswith("[x]") or s[1:].lstrip().startswith("]")
+    return bool(s) and s[0] in CHECKBOX_GLYPHS
 
 INLINE_CHOICE_RE = re.compile(
     rf"(?:^|\s){CHECKBOX_ANY}\s*([^\[\]•·\-\u2022]+?)(?=(?:\s*{CHECKBOX_ANY}|\s*[•·\-]|$))"
@@ -206,6 +227,10 @@ INLINE_CHOICE_RE = re.compile(
 
 YESNO_SET = {"yes", "no", "y", "n"}
 
+# Separators for free-text option lists ("Radio, TV / Friend; Other"): "/" and ";"
+# are mapped to "," so a list splits with text.translate(OPTION_SEP_TRANS).split(",")
+OPTION_SEP_TRANS = str.maketrans("/;", ",,")
+
 PHONE_RE   = re.compile(r"\b(phone|cell|mobile|telephone)\b", re.I)
 EMAIL_RE   = re.compile(r"\bemail\b", re.I)
 ZIP_RE     = re.compile(r"\b(zip|postal)\b", re.I)
@@ -226,6 +251,7 @@ IF_YES_INLINE_RE = re.compile(
     r'(.+?)\s*\[\s*\]\s*Yes\s*\[\s*\]\s*No\s+If\s+yes',
     re.I
 )
+IF_YES_CUE_RE = re.compile(r'\bif\s+yes', re.I)
 
 PAGE_NUM_RE = re.compile(r"^\s*(?:page\s*\d+(?:\s*/\s*\d+)?|\d+\s*/\s*\d+)\s*$", re.I)
 ADDRESS_LIKE_RE = re.compile(
@@ -288,17 +314,172 @@ PREFERRED_CONTACT_PATTERNS = [
     re.compile(r'preferred\s+contact\s+method', re.I),
 ]
 
+# Fused forms of the lists above for yes/no membership tests: one regex search per
+# category instead of a Python loop over the individual patterns
+def _fuse_patterns(patterns: List[re.Pattern]) -> re.Pattern:
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.I)
+
+SEX_GENDER_ANY_RE = _fuse_patterns(SEX_GENDER_PATTERNS)
+MARITAL_ANY_RE = _fuse_patterns(MARITAL_STATUS_PATTERNS)
+PREFERRED_CONTACT_ANY_RE = _fuse_patterns(PREFERRED_CONTACT_PATTERNS)
+
+# Words that start a new section rather than continue a multi-line heading
+SECTION_KW_RE = re.compile(r"\b(information|practice|consent|authorization|attestation|form|release)\b", re.I)
+
+# Column gap in space-aligned grid headers ("Appearance     Function     Habits")
+WIDE_GAP_RE = re.compile(r"\s{5,}")
+
+# Consent/risk disclosure language and medical terms used to let instructional
+# paragraphs through as consent body text (substring semantics, no word boundaries)
+CONSENT_BODY_RE = re.compile(
+    r"risk|complication|procedure|treatment|may include|may result|may cause|may occur|"
+    r"include but not limited|understand that|i consent|i acknowledge|informed about",
+    re.I,
+)
+MEDICAL_TERM_RE = re.compile(r"endodontic|dental|tooth|surgery|anesthesia|medication|extraction", re.I)
+
+# Per-line gates in parse_to_questions
+SHARE_DATES_RE = re.compile(r"please\s+share\s+the\s+following\s+dates", re.I)
+SEND_TEXT_RE = re.compile(r"\bsend me\b.*\btext\b", re.I)
+SEND_EMAIL_RE = re.compile(r"\bsend me\b.*\bemail\b", re.I)
+NAME_OF_SCHOOL_RE = re.compile(r"name\s+of\s+school", re.I)
+SEX_MF_RE = re.compile(r'\b(sex|gender)\s*[:\-]?\s*(?:M\s*or\s*F|M/F|Male/Female|Mor\s*F)', re.I)
+# Lines never contain newlines, so a greedy '.*' already runs to the end and the
+# trailing '$' / lazy '.*?$' only added per-character end-of-line probes.
+CIRCLE_ONE_RE = re.compile(r'(?:please\s+)?circle\s+one\s*:?\s*(.*)', re.I)
+FOLLOWUP_TAIL_RE = re.compile(r'\s+(if\s+yes|if\s+so|please\s+explain|explain\s+below).*', re.I)
+FOLLOWUP_PHRASE_RE = re.compile(r'\b(if\s+yes|please\s+explain|if\s+so|explain\s+below)\b', re.I)
+# Next-line follow-up cues. LEAD is an anchored, unbounded prefix test and HINT a
+# word-bounded test anywhere in the line; neither result implies the other, so a
+# single fused search could not answer both and they stay separate patterns.
+FOLLOWUP_LEAD_RE = re.compile(r'^\s*(if\s+yes|please\s+explain|explain|comment|list|details?)', re.I)
+FOLLOWUP_HINT_RE = re.compile(r"\b(list|explain|if so|name of)\b", re.I)
+INSURANCE_TERM_RE = re.compile(r"\b(insured|subscriber|policy|member|insurance)\b")
+NUMBERED_HEADING_RE = re.compile(r'^\d+\.\s+[A-Z]')
+BULLET_ITEM_RE = re.compile(r'^[●•·\-\*]\s+')
+ALPHA_WORD_RE = re.compile(r'[A-Za-z]{3,}')
+TRAILING_UNDERSCORES_RE = re.compile(r'_+$')
+UNDERSCORE_RUN_RE = re.compile(r'_{5,}')
+
+# Default-input title filters (Archivev20 Fix 2, Archivev22/23 enhancements):
+# practice addresses, contact details, document noise and instruction lines.
+# Anchored filters are bucketed by the title's first character (lowercased, all
+# decimal digits under "0") so a title is only matched against the ones whose
+# anchor can apply; the unanchored filters are searched for every title.
+_DIGIT_PREFIX_SKIPS = [re.compile(p, re.I) for p in (
+    r'^\d{5}$',  # Just a zip code
+    r'^\d+\s+[NS]?\s*\w+\s+(Ave|Avenue|Rd|Road|St|Street|Blvd|Boulevard)\b',  # Street address
+    r'^\d+[A-Z]?\s+S\s+\w+\s+(Ave|Rd|St|Blvd)',  # Address starting with number
+    r'^\d{3}[-.]\d{3}[-.]\d{4}$',  # Phone number (standalone)
+)]
+_NOISE_PREFIX_SKIPS = [re.compile(r'^[=|]+\s*\w{1,3}\s*[=|]+$', re.I)]  # Symbol noise like "= ie |"
+SKIP_TITLE_PREFIX_PATTERNS = {
+    "0": _DIGIT_PREFIX_SKIPS,
+    "p": [re.compile(r'^please\s+(ensure|note|read|remember)', re.I)],  # Instructions
+    "*": [re.compile(r'^[*]+', re.I)],  # Lines starting with asterisks (often instructions)
+    "=": _NOISE_PREFIX_SKIPS,
+    "|": _NOISE_PREFIX_SKIPS,
+    "(": [re.compile(r'^\([A-Z]{2,}\s+[A-Za-z\s]+\)$', re.I)],  # Parenthetical codes like "(CF Gingivectomy)"
+    "w": [re.compile(r'^within\s+[-\d]+\s+(days?|hours?|weeks?)', re.I)],  # Time references like "within -5 days"
+}
+SKIP_TITLE_PATTERNS = [re.compile(p, re.I) for p in (
+    r',\s*[A-Z]{2}\s+\d{5}$',  # City, State Zip
+    # Website domain (with optional space before dot); one word char is enough for
+    # a hit test, and '\w+' here re-scanned every word run from each of its offsets
+    r'\w\s*\.\s*(com|org|net|us|info|dental)\b',
+    r'\b\d{3}[-.]\d{3}[-.]\d{4}\b',  # Phone number anywhere in text
+    r'@\s*\w+\s*\.\s*\w+',  # Email address (with optional spaces)
+    r'\(pg\.\s*\d+\)',  # Page number reference
+)]
+# Every unanchored filter needs one of these literals (the phone pattern its
+# '-'/'.' separator), so titles without any of them skip the searches entirely
+SKIP_TITLE_CUE_CHARS = ",.@(-"
+# Section-heading questions ("What are the risks?"), matched against the lowered title
+HEADING_QUESTION_RE = re.compile(
+    r'^(?:what\s+(are|is)\s+the\s+(risks?|benefits?|alternatives?|procedures?|options?)'
+    r'|how\s+(does|do|will|can)\s+(the|this|it)'
+    r'|why\s+(is|do|does|would)'
+    r'|when\s+(should|will|can)'
+    r'|who\s+(should|will|can|is))'
+)
+
+# Junk-title phrase sets for is_instructional_text (Archivev18 Fix 2 / Archivev22),
+# each folded into one alternation so a title is scanned once per set
+RISK_KEYWORDS = (
+    'adverse', 'reaction', 'numbness', 'tingling', 'bleeding', 'infection',
+    'swelling', 'fracture', 'damage', 'injury', 'pain', 'sensitivity',
+    'complication', 'risk', 'temporary', 'permanent', 'may result', 'may cause',
+    'can lead', 'potential', 'possible', 'delayed healing', 'post-operative',
+    'post treatment', 'involving', 'involvement',
+)
+RISK_KEYWORD_RE = re.compile("|".join(map(re.escape, RISK_KEYWORDS)))
+INSTRUCTIONAL_PHRASES = (
+    "thank you for",
+    "medication that you may be taking",
+    "could have an important",
+    "interrelationship with",
+    "health problems that you may have",
+    "please read",
+    "please ensure",
+    "please note",
+    "i understand that providing incorrect",
+    "to the best of my knowledge",
+    "the questions on this form have been",
+    "accurately answered",
+    "providing incorrect information can be",
+    "although dental professionals",
+    "your mouth is a part of",
+    "have been explained to me",
+    "i understand that",
+    "these treatments include",
+    "alternative methods",
+    "risks and complications",
+    "may include (but",
+    "are not limited to",
+    "has performed a thorough examination",
+    "has determined that",
+)
+INSTRUCTIONAL_PHRASE_RE = re.compile("|".join(map(re.escape, INSTRUCTIONAL_PHRASES)))
+# Long-text connectives and document-title cues for is_instructional_text; the
+# form-title keywords are shared with the default-input document-title skip
+CONNECTING_PHRASES = (" that you ", " which ", " could ", " should ", " would ", " may ", " can ")
+FORM_TITLE_KEYWORDS = ('consent', 'form', 'information', 'agreement', 'authorization', 'release', 'disclosure')
+SECTION_TOPIC_KEYWORDS = ('risks', 'benefits', 'alternatives', 'procedures', 'treatment')
+# Bullet lines in consent forms that describe risks rather than options (default-input skip)
+BULLET_RISK_KEYWORDS = ('risk', 'complication', 'may', 'can', 'possible', 'potential',
+                        'numbness', 'infection', 'swelling', 'pain', 'sensitivity',
+                        'bleeding', 'reaction', 'damage', 'fracture', 'decay',
+                        'temporary', 'permanent', 'post', 'treatment', 'procedure')
+
+# 1..10 scale rows (pain scale etc.): exactly ten numbers, 1 through 10
+DIGIT_RUN_RE = re.compile(r"\b\d+\b")
+PAIN_SCALE_VALUES = list(range(1, 11))
+
 PHONE_PATTERNS = [
     (r'work\s+phone', 'work_phone'),
     (r'home\s+phone', 'home_phone'),
     (r'(?:cell|mobile)\s+phone', 'cell_phone'),
 ]
 
-ALLOWED_TYPES = {"input", "date", "states", "radio", "dropdown", "checkbox", "terms", "signature", "block_signature"}
+MODENTO_KEY_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+ALLOWED_TYPES = frozenset({"input", "date", "states", "radio", "dropdown", "checkbox", "terms", "signature", "block_signature"})
+# Titles dropped outright by the final sanitation pass (compared lowercased)
+JUNK_TITLES = frozenset({"<<<", ">>>", "-", "—", "continued on back side"})
 
 PRIMARY_SUFFIX = "__primary"
 SECONDARY_SUFFIX = "__secondary"
 
+# Opening prompt of a Medical/Dental History conditions block
+CONDITIONS_PROMPT_RE = re.compile(r"\b(have you ever had|do you have|are you taking)\b", re.I)
+
+# Bare keys that get an insurance scope suffix inside an insurance section
+# (already-suffixed keys are never members, so no endswith check is needed)
+SCOPED_INSURANCE_KEYS = frozenset({"ssn", "insurance_id_number"})
+
+# Sections whose checkbox lists are consolidated into condition dropdowns
+CONDITION_SECTIONS = frozenset({"Medical History", "Dental History"})
+
 # Medical condition tokens for consolidation detection
 _COND_TOKENS = {"diabetes","arthritis","rheumat","hepatitis","asthma","stroke","ulcer",
                 "thyroid","cancer","anemia","glaucoma","osteoporosis","seizure","tb","tuberculosis",
@@ -416,14 +597,14 @@ def split_multi_question_line(line: str) -> List[str]:
         
         # Add the segment from last_end to split_pos
         segment = line[last_end:split_pos].strip()
-        if segment and re.search(CHECKBOX_ANY, segment):
+        if segment and has_checkbox_token(segment):
             segments.append(segment)
         
         last_end = split_pos
     
     # Add the final segment
     final_segment = line[last_end:].strip()
-    if final_segment and re.search(CHECKBOX_ANY, final_segment):
+    if final_segment and has_checkbox_token(final_segment):
         segments.append(final_segment)
     
     # Return segments if we successfully split, otherwise original line
@@ -504,6 +685,11 @@ KNOWN_FIELD_LABELS = {
     'date_of_release': r'\bdate\s+of\s+release(?=[^a-zA-Z]|$)',
 }
 
+# All known field labels as one alternation, for "does any label occur" checks
+KNOWN_FIELD_LABEL_RE = re.compile("|".join(f"(?:{p})" for p in KNOWN_FIELD_LABELS.values()), re.I)
+# Per-label compiled patterns, for locating every label occurrence in a line
+KNOWN_FIELD_LABEL_PATTERNS = [(key, re.compile(p, re.I)) for key, p in KNOWN_FIELD_LABELS.items()]
+
 
 def split_by_checkboxes_no_colon(line: str) -> List[str]:
     """
@@ -531,13 +717,13 @@ def split_by_checkboxes_no_colon(line: str) -> List[str]:
     
     for pos in split_positions:
         segment = line[last_pos:pos].strip()
-        if segment and re.search(CHECKBOX_ANY, segment):
+        if segment and has_checkbox_token(segment):
             segments.append(segment)
         last_pos = pos
     
     # Add final segment
     final_segment = line[last_pos:].strip()
-    if final_segment and re.search(CHECKBOX_ANY, final_segment):
+    if final_segment and has_checkbox_token(final_segment):
         segments.append(final_segment)
     
     return segments if len(segments) >= 2 else [line]
@@ -551,10 +737,15 @@ def split_by_known_labels(line: str) -> List[str]:
     NEW: Also handles adjacent labels with underscores (SSN_______ Date of Birth______)
     Enhanced: Now detects 2+ tabs as field separators (not just 4+ spaces)
     """
+    # A line with no known label cannot split; one union search rules that out
+    # before running every per-label pattern
+    if KNOWN_FIELD_LABEL_RE.search(line) is None:
+        return [line]
+    
     # Find all known label matches in the line
     label_matches = []
-    for field_key, pattern in KNOWN_FIELD_LABELS.items():
-        for match in re.finditer(pattern, line, re.I):
+    for field_key, pattern in KNOWN_FIELD_LABEL_PATTERNS:
+        for match in pattern.finditer(line):
             label_matches.append((match.start(), match.end(), field_key, match.group(0)))
     
     # Sort by position
@@ -655,7 +846,7 @@ def split_label_with_subfields(line: str) -> List[str]:
     """
     # Phase 4 Fix 8: Check if line has checkboxes first
     # Lines with checkboxes should be kept together as radio/dropdown fields
-    if re.search(CHECKBOX_ANY, line):
+    if has_checkbox_token(line):
         return [line]
     
     # Pattern 1: Label ending with colon, followed by multiple capitalized words separated by 4+ spaces
@@ -879,8 +1070,8 @@ def enhanced_split_multi_field_line(line: str) -> List[str]:
     # Phase 4 Fix 8: Check if this is a preferred contact field with checkboxes
     # These should NOT be split by known label patterns (Home Phone, Work Phone, etc.)
     # as those are options for a single radio field, not separate input fields
-    has_preferred_contact = any(p.search(line) for p in PREFERRED_CONTACT_PATTERNS)
-    if has_preferred_contact and re.search(CHECKBOX_ANY, line):
+    has_preferred_contact = bool(PREFERRED_CONTACT_ANY_RE.search(line))
+    if has_preferred_contact and has_checkbox_token(line):
         return [line]
     
     # Enhancement 1: Try compound field splitting with slashes
@@ -936,7 +1127,7 @@ def detect_sex_gender_field(line: str) -> Optional[Tuple[str, str]]:
             # Check if this is a checkbox-based field
             # Look for checkboxes after the label
             after_label = line[match.end():]
-            has_checkboxes = bool(re.search(CHECKBOX_ANY, after_label))
+            has_checkboxes = has_checkbox_token(after_label)
             
             if has_checkboxes or match.group(0).count('□') >= 2 or match.group(0).count('[') >= 2:
                 # This is a checkbox-based field, extract the entire field including all checkboxes
@@ -1147,9 +1338,9 @@ def preprocess_lines(lines: List[str]) -> List[str]:
         
         # Archivev12 Fix: Try multiple splitting strategies
         # Strategy 1: Check if line has sex/gender, marital, or preferred contact patterns
-        has_sex_gender = any(p.search(line) for p in SEX_GENDER_PATTERNS)
-        has_marital = any(p.search(line) for p in MARITAL_STATUS_PATTERNS)
-        has_preferred_contact = any(p.search(line) for p in PREFERRED_CONTACT_PATTERNS)
+        has_sex_gender = bool(SEX_GENDER_ANY_RE.search(line))
+        has_marital = bool(MARITAL_ANY_RE.search(line))
+        has_preferred_contact = bool(PREFERRED_CONTACT_ANY_RE.search(line))
         
         if has_sex_gender or has_marital or has_preferred_contact:
             # Try complex multi-field detection first for these special cases
@@ -1197,7 +1388,7 @@ def extract_orphaned_checkboxes_and_labels(current_line: str, next_line: str) ->
         return []
     
     # Check if next line has no checkboxes but has text
-    if re.search(CHECKBOX_ANY, next_line):
+    if has_checkbox_token(next_line):
         return []  # Next line also has checkboxes, not the label line
     
     next_stripped = next_line.strip()
@@ -1509,12 +1700,25 @@ CANON_LABELS = {
 
 LABEL_ALTS = sorted(CANON_LABELS.keys(), key=len, reverse=True)
 
+NON_WORD_RE = re.compile(r"[^\w\s]")
+WHITESPACE_RUN_RE = re.compile(r"\s+")
+
 def _sanitize_words(s: str) -> str:
     s = s.lower()
-    s = re.sub(r"[^\w\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = NON_WORD_RE.sub(" ", s)
+    s = WHITESPACE_RUN_RE.sub(" ", s).strip()
     return s
 
+# Per-phrase data for try_split_known_labels, built once instead of
+# re-sanitizing, re-escaping and re-looking-up every phrase on every line:
+# (sanitized phrase, word-bounded pattern, canonical label), in LABEL_ALTS order.
+LABEL_ALT_MATCHERS = [
+    (_sanitize_words(phrase),
+     re.compile(r'\b' + re.escape(_sanitize_words(phrase)) + r'\b'),
+     CANON_LABELS.get(phrase, phrase.title()))
+    for phrase in LABEL_ALTS
+]
+
 def try_split_known_labels(line: str) -> List[str]:
     """
     Detect and split compound field labels from a single line.
@@ -1544,14 +1748,12 @@ def try_split_known_labels(line: str) -> List[str]:
     
     s_sanit = _sanitize_words(s_de_rep)
     hits: List[Tuple[int, str]] = []
-    for phrase in LABEL_ALTS:
-        p = _sanitize_words(phrase)
+    for _p, pattern, canon in LABEL_ALT_MATCHERS:
         # Archivev20 Fix 9: Use word boundary matching to avoid false positives
         # "message alerts" was matching "age" and "ss", causing incorrect label extraction
-        pattern = r'\b' + re.escape(p) + r'\b'
-        match = re.search(pattern, s_sanit)
+        match = pattern.search(s_sanit)
         if match:
-            hits.append((match.start(), CANON_LABELS.get(phrase, phrase.title())))
+            hits.append((match.start(), canon))
     
     # Enhanced: If we have explicit separators and found at least 2 distinct fields, split them
     # This catches compound fields like "Name / DOB / SSN" even if only 2 of 3 are in CANON_LABELS
@@ -1581,9 +1783,8 @@ def try_split_known_labels(line: str) -> List[str]:
                         # Check if this field is in our hits
                         matched = False
                         part_sanit = _sanitize_words(part)
-                        for phrase in LABEL_ALTS:
-                            if _sanitize_words(phrase) in part_sanit:
-                                canon = CANON_LABELS.get(phrase, phrase.title())
+                        for p, _pattern, canon in LABEL_ALT_MATCHERS:
+                            if p in part_sanit:
                                 if canon not in result:
                                     result.append(canon)
                                     matched = True
@@ -1619,9 +1820,17 @@ COMPOUND_YN_RE = re.compile(
     re.I,
 )
 
+# Cheap necessary conditions checked before the lazy-prefix searches above, which
+# otherwise retry from every start position on lines that cannot match
+YES_WORD_RE = re.compile(r"\b(?:Yes|Y)\b", re.I)
+
 def extract_compound_yn_prompts(line: str) -> List[str]:
     prompts = []
-    for m in COMPOUND_YN_RE.finditer(normalize_glyphs_line(line)):
+    norm = normalize_glyphs_line(line)
+    # COMPOUND_YN_RE needs two checkbox tokens; it is case-insensitive, so any
+    # bracket (which may be an "[X]") sends the line to the regex
+    compound_matches = COMPOUND_YN_RE.finditer(norm) if "[" in norm or has_checkbox_token(norm) else ()
+    for m in compound_matches:
         p = collapse_spaced_caps(m.group("prompt")).strip(" :;-")
         if p:
             # Archivev19 Fix 2: Check if there's continuation text after the Yes/No checkboxes
@@ -1642,7 +1851,7 @@ def extract_compound_yn_prompts(line: str) -> List[str]:
                 p = p + " " + continuation
             
             prompts.append(p)
-    if not prompts:
+    if not prompts and YES_WORD_RE.search(line):
         m2 = YN_SIMPLE_RE.search(line)
         if m2:
             p = collapse_spaced_caps(m2.group("prompt")).strip(" :;-")
@@ -1789,17 +1998,22 @@ def extract_yn_with_followup(line: str) -> Tuple[Optional[str], bool]:
         "Do you smoke? [ ] Yes [ ] No"
         -> ("Do you smoke?", False)
     """
-    # Try explicit "if yes" pattern first
-    match = IF_YES_FOLLOWUP_RE.search(line)
-    if match:
-        question = match.group(1).strip()
-        return (question, True)
-    
-    # Try inline "if yes" pattern
-    match = IF_YES_INLINE_RE.search(line)
-    if match:
-        question = match.group(1).strip()
-        return (question, True)
+    # Both "if yes" patterns need a "[ ]" box and an "If yes" cue. They also
+    # start with an unanchored (.+?), so a failed search() retried that prefix
+    # from every offset; on a newline-free line any match starts at 0 anyway,
+    # so match() gives the same result without the quadratic retries.
+    if "[" in line and IF_YES_CUE_RE.search(line):
+        # Try explicit "if yes" pattern first
+        match = IF_YES_FOLLOWUP_RE.match(line)
+        if match:
+            question = match.group(1).strip()
+            return (question, True)
+        
+        # Try inline "if yes" pattern
+        match = IF_YES_INLINE_RE.match(line)
+        if match:
+            question = match.group(1).strip()
+            return (question, True)
     
     # Try existing compound pattern
     prompts = extract_compound_yn_prompts(line)
@@ -1836,7 +2050,7 @@ def create_yn_question_with_followup(
         question_text,
         section,
         "radio",
-        control={"options": [make_option("Yes", True), make_option("No", False)]}
+        control={"options": make_yes_no_options()}
     )
     
     # Follow-up input field (conditional on Yes)
@@ -1880,11 +2094,11 @@ def _emit_parent_guardian_override(title: str, key: str, qtype: str, ctrl: Dict,
 
 def _insurance_scope_key(key: str, section: str, insurance_scope: Optional[str], title: str, debug: bool) -> str:
     """Attach __primary/__secondary to SSN/ID under insurance context; prefer patient-level elsewhere."""
-    low = title.lower()
-    if "insurance" in section.lower() or insurance_scope or re.search(r"\b(insured|subscriber|policy|member)\b", low):
-        if key == "ssn" and insurance_scope:
-            if debug: print(f"  [debug] gate: ssn_scoped -> '{title}' -> ssn{insurance_scope}")
-            return f"ssn{insurance_scope}"
+    # Scoping requires insurance_scope, which already counts as insurance context,
+    # so the section/title context checks never change the result
+    if key == "ssn" and insurance_scope:
+        if debug: print(f"  [debug] gate: ssn_scoped -> '{title}' -> ssn{insurance_scope}")
+        return f"ssn{insurance_scope}"
     return key
 
 def _insurance_id_ssn_fanout(title: str) -> Optional[List[Tuple[str, str, Dict]]]:
@@ -1932,7 +2146,7 @@ def detect_fill_in_blank_field(line: str, prev_line: Optional[str] = None, next_
     
     # Count underscore vs non-underscore content
     underscore_count = line.count('_')
-    non_underscore_chars = len([c for c in line if c not in ('_', ' ', '\t')])
+    non_underscore_chars = len(line) - underscore_count - line.count(' ') - line.count('\t')
     
     # If line is mostly underscores (2:1 ratio), it's a fill-in-blank
     if underscore_count < 5 or underscore_count < non_underscore_chars * 2:
@@ -1949,7 +2163,7 @@ def detect_fill_in_blank_field(line: str, prev_line: Optional[str] = None, next_
     # Pattern: blank underscore line followed by "Patient Signature" or similar
     if next_line:
         next_clean = next_line.strip().rstrip(':.')
-        if next_clean and len(next_clean) < 100 and not re.search(CHECKBOX_ANY, next_clean):
+        if next_clean and len(next_clean) < 100 and not has_checkbox_token(next_clean):
             # Check if next line looks like a field label (not a sentence)
             # Common signature/name/date labels
             signature_patterns = [
@@ -1967,7 +2181,7 @@ def detect_fill_in_blank_field(line: str, prev_line: Optional[str] = None, next_
     # Try to use previous line as label if available
     if prev_line:
         prev_clean = prev_line.strip().rstrip(':.')
-        if prev_clean and len(prev_clean) < 100 and not re.search(CHECKBOX_ANY, prev_clean):
+        if prev_clean and len(prev_clean) < 100 and not has_checkbox_token(prev_clean):
             # Make sure it's not a heading or instructional text
             if not is_heading(prev_clean):
                 # Archivev22 Enhancement: Don't use long descriptive sentences as labels for underscores
@@ -1978,7 +2192,7 @@ def detect_fill_in_blank_field(line: str, prev_line: Optional[str] = None, next_
     # Archivev22 Enhancement: Don't create generic placeholders for orphaned underscores
     # These are often signature lines or date lines without clear context
     # Only create them if the line has some identifying text
-    line_text = re.sub(r'_{5,}', '', line).strip()
+    line_text = UNDERSCORE_RUN_RE.sub('', line).strip()
     if line_text and len(line_text) >= 2:
         # Has some text, create generic with that text
         return (slugify(line_text), line_text)
@@ -2025,6 +2239,14 @@ def detect_multi_blank_line_with_labels(line: str, next_lines: List[str]) -> Opt
     return None
 
 
+# Checkbox + Yes/No + continuation text in a single scan. The continuation must be
+# at least 10 chars once trimmed, and must not look like spaced-out OCR letters
+# ("N o D ental Insurance"), which is checked case-sensitively.
+INLINE_CHECKBOX_TEXT_RE = re.compile(
+    r'^\s*' + CHECKBOX_ANY + r'\s*(Yes|No)[\s,]+(?!(?-i:[a-z]\s+[A-Z]))([^\s,].{8,}?\S)\s*$',
+    re.I
+)
+
 def detect_inline_checkbox_with_text(line: str) -> Optional[Tuple[str, str, str]]:
     """
     Detect inline checkboxes with continuation text.
@@ -2040,25 +2262,14 @@ def detect_inline_checkbox_with_text(line: str) -> Optional[Tuple[str, str, str]
     # Archivev21 Fix 6: Make pattern more strict to avoid false positives
     # Require comma or "send" after Yes/No to ensure it's a continuation, not a separate field
     # Pattern: checkbox followed by Yes/No, then comma/space and continuation text
-    pattern = r'^\s*' + CHECKBOX_ANY + r'\s*(Yes|No)[\s,]+(.*?)$'
-    match = re.match(pattern, line, re.I)
-    
+    # Need meaningful continuation text (at least 10 chars), and reject likely OCR
+    # errors such as "[ ] N o D ental Insurance" - both enforced by the regex
+    match = INLINE_CHECKBOX_TEXT_RE.match(line)
     if not match:
         return None
     
     option = match.group(1).capitalize()  # "Yes" or "No"
-    continuation = match.group(2).strip()
-    
-    # Need meaningful continuation text (at least 10 chars)
-    # Archivev21 Fix 6: Also check that continuation doesn't look like a standalone field label
-    # (i.e., doesn't start with a capital letter followed by lowercase and end with "Insurance", "Plan", etc.)
-    if len(continuation) < 10:
-        return None
-    
-    # Check if this looks like a false positive (e.g., "[ ] N o D ental Insurance")
-    # If continuation starts with lowercase or has spaces between capital letters, likely OCR error
-    if re.match(r'^[a-z]\s+[A-Z]', continuation):
-        return None  # Likely "N o D ental" pattern - not a real continuation
+    continuation = match.group(2)
     
     # Archivev21 Fix 6: Clean continuation text to fix any remaining OCR errors
     continuation_cleaned = clean_field_title(continuation)
@@ -2431,6 +2642,32 @@ def detect_inline_text_options(line: str) -> Optional[Tuple[str, str, List[Tuple
     return None
 
 
+# Field kinds for keys emitted by detect_multiple_label_colon_line. Exact keys
+# are checked first (none of them contain a substring needle), then the
+# substring table in priority order.
+MULTI_LABEL_EXACT_TYPES = {
+    "ss": "ssn", "social_security": "ssn",
+    "state": "states", "st": "states",
+    "birth": "date",
+}
+MULTI_LABEL_SUBSTR_TYPES = (
+    ("phone", "phone"), ("email", "email"), ("zip", "zip"), ("ssn", "ssn"),
+    ("date", "date"), ("dob", "date"),
+)
+
+
+def multi_label_field_type(field_key: str) -> str:
+    """Return "states", "date", or the input_type for a multi-label field key."""
+    fk = field_key.lower()
+    kind = MULTI_LABEL_EXACT_TYPES.get(fk)
+    if kind:
+        return kind
+    for needle, kind in MULTI_LABEL_SUBSTR_TYPES:
+        if needle in fk:
+            return kind
+    return "text"
+
+
 def detect_space_separated_labels(line: str) -> Optional[List[Tuple[str, str]]]:
     """
     Detect lines with multiple labels separated by significant spacing (10+ spaces).
@@ -2543,6 +2780,16 @@ def detect_embedded_parenthetical_field(line: str) -> Optional[Tuple[str, str]]:
     return None
 
 
+def _has_min_columns(line: str, n: int = 3) -> bool:
+    """True if the stripped line splits into at least n columns on WIDE_GAP_RE (stops at the (n-1)th gap)."""
+    gaps = 0
+    for _ in WIDE_GAP_RE.finditer(line.strip()):
+        gaps += 1
+        if gaps >= n - 1:
+            return True
+    return False
+
+
 # ============================================================================
 # SECTION 3: MAIN PARSING LOGIC
 # ============================================================================
@@ -2620,10 +2867,96 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
     seen_signature = False
     insurance_scope: Optional[str] = None  # "__primary" / "__secondary"
 
+    # Stripped and stripped + collapsed forms of every line, computed once. The main
+    # loop and its look-ahead/look-back windows (including the blank-line checks)
+    # index into these instead of re-stripping and re-collapsing.
+    stripped = [ln.strip() for ln in lines]
+    collapsed = [collapse_spaced_caps(ln) for ln in stripped]
+
+    # Per-line flags for the look-ahead/look-back windows. Checkbox presence is not
+    # changed by stripping or collapse_spaced_caps, so one array serves both raw and
+    # collapsed lines; checkbox_counts holds the number of checkbox tokens per line
+    # for the grid and orphaned-checkbox gates. Heading flags (for the raw line) are
+    # filled in on first use.
+    has_checkbox = [has_checkbox_token(ln) for ln in lines]
+    checkbox_counts = [len(CHECKBOX_ANY_RE.findall(ln)) if cb else 0 for ln, cb in zip(lines, has_checkbox)]
+    heading_flags: List[Optional[bool]] = [None] * len(lines)
+
+    # Nearest non-blank line before / after each index (-1 / len(lines) if none), so
+    # the blank-skipping look-back and look-ahead are a single lookup
+    prev_nonblank = [-1] * len(lines)
+    next_nonblank = [len(lines)] * len(lines)
+    last = -1
+    for idx, ln in enumerate(stripped):
+        prev_nonblank[idx] = last
+        if ln:
+            last = idx
+    last = len(lines)
+    for idx in range(len(lines) - 1, -1, -1):
+        next_nonblank[idx] = last
+        if stripped[idx]:
+            last = idx
+
+    def heading_at(idx: int) -> bool:
+        flag = heading_flags[idx]
+        if flag is None:
+            flag = heading_flags[idx] = is_heading(lines[idx])
+        return flag
+
+    # Several branches probe for a multi-column grid at the same line; memoize the
+    # (read-only) detection result per (line index, section) for this call
+    grid_cache: Dict[Tuple[int, str], Optional[dict]] = {}
+
+    def detect_grid_at(idx: int, section: str) -> Optional[dict]:
+        cache_key = (idx, section)
+        if cache_key not in grid_cache:
+            grid_cache[cache_key] = detect_multicolumn_checkbox_grid(lines, idx, section)
+        return grid_cache[cache_key]
+
+    # Line filters that depend only on the line (and its two predecessors) run in a
+    # single pass up front. skip_reason holds an index into skip_labels (0 = keep);
+    # instructional_skip marks instructional text that is not consent body text,
+    # which the main loop still lets through inside a Consent section.
+    skip_labels = ("", "numbered list item", "form metadata", "practice location")
+    skip_reason = bytearray(len(lines))
+    instructional_skip = bytearray(len(lines))
+    prev_window: deque = deque(maxlen=2)  # the two raw lines before idx
+    for idx, ln in enumerate(collapsed):
+        prev_context = tuple(prev_window)
+        prev_window.append(lines[idx])
+        if not ln:
+            continue
+        # NEW Improvement 1: numbered list items (e.g., "(i)", "(ii)", "(vii)") are
+        # part of consent/terms text and should not be separate fields
+        if is_numbered_list_item(ln):
+            skip_reason[idx] = 1
+        # NEW Improvement 6: form metadata (revision codes, copyright, etc.)
+        elif is_form_metadata(ln):
+            skip_reason[idx] = 2
+        # NEW Improvement 7: practice location text (office addresses)
+        elif is_practice_location_text(ln, prev_context):
+            skip_reason[idx] = 3
+        # Improvement #7: instructional paragraphs (consent/legal text)
+        # Archivev23 Fix: consent disclosure paragraphs (risks, complications,
+        # procedures, treatments) are kept so they can be captured as terms
+        elif is_instructional_paragraph(ln):
+            # Short-circuit: the medical-term scan only runs for consent-keyword
+            # lines of 200 characters or fewer
+            is_consent_body = (
+                CONSENT_BODY_RE.search(ln) is not None
+                and (len(ln) > 200 or MEDICAL_TERM_RE.search(ln) is not None)
+            )
+            if not is_consent_body:
+                instructional_skip[idx] = 1
+
+    n_lines = len(lines)  # lines is not modified inside the loop
+    emitted_keys: Set[str] = set()  # keys of questions[:emitted_keys_synced]
+    emitted_keys_synced = 0
     i = 0
-    while i < len(lines):
+    while i < n_lines:
         raw = lines[i]
-        line = collapse_spaced_caps(raw.strip())
+        line = collapsed[i]
+        line_lower = line.lower()
         
         # Debug specific lines
         if debug and 'Appearance' in raw and 'Function' in raw:
@@ -2632,58 +2965,20 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         if not line:
             i += 1; continue
 
-        # NEW Improvement 1: Skip numbered list items (e.g., "(i)", "(ii)", "(vii)")
-        # These are part of consent/terms text and should not be separate fields
-        if is_numbered_list_item(line):
+        if skip_reason[i]:
             if debug:
-                print(f"  [debug] skipping numbered list item: '{line[:60]}'")
+                print(f"  [debug] skipping {skip_labels[skip_reason[i]]}: '{line[:60]}'")
             i += 1
             continue
 
-        # NEW Improvement 6: Skip form metadata (revision codes, copyright, etc.)
-        # Form identifiers should not become fields
-        if is_form_metadata(line):
+        # Instructional text is skipped unless we're in a Consent section, where it
+        # is allowed through to be captured as a terms field later
+        if instructional_skip[i] and cur_section != "Consent":
             if debug:
-                print(f"  [debug] skipping form metadata: '{line[:60]}'")
+                print(f"  [debug] skipping instructional text: '{line[:60]}...'")
             i += 1
             continue
 
-        # NEW Improvement 7: Skip practice location text (office addresses)
-        # Practice addresses should not become data fields
-        prev_context = lines[max(0, i-2):i] if i > 0 else []
-        if is_practice_location_text(line, prev_context):
-            if debug:
-                print(f"  [debug] skipping practice location: '{line[:60]}'")
-            i += 1
-            continue
-
-        # Improvement #7: Skip instructional paragraphs (consent/legal text)
-        # Long paragraphs with legal/consent language should not become fields
-        # Archivev23 Fix: Don't skip consent disclosure paragraphs - they should be captured as terms
-        # Allow through if: in Consent section OR looks like consent/risk disclosure body text
-        if is_instructional_paragraph(line):
-            # Check if this might be consent body text that should be captured as terms
-            # Consent body text typically: mentions risks, complications, procedures, treatments
-            # AND is reasonably long (multiple sentences about medical/dental topics)
-            consent_body_keywords = ['risk', 'complication', 'procedure', 'treatment', 'may include',
-                                    'may result', 'may cause', 'may occur', 'include but not limited',
-                                    'understand that', 'i consent', 'i acknowledge', 'informed about']
-            has_consent_keywords = any(kw in line.lower() for kw in consent_body_keywords)
-            has_medical_terms = any(term in line.lower() for term in ['endodontic', 'dental', 'tooth', 'surgery', 
-                                                                      'anesthesia', 'medication', 'extraction'])
-            is_consent_body = has_consent_keywords and (has_medical_terms or len(line) > 200)
-            
-            # If in Consent section or looks like consent body, allow it through for terms capture
-            # Otherwise skip as regular instructional text
-            if cur_section == "Consent" or is_consent_body:
-                # Allow through - will be captured as terms field later
-                pass
-            else:
-                if debug:
-                    print(f"  [debug] skipping instructional text: '{line[:60]}...'")
-                i += 1
-                continue
-
         # Insurance anchoring
         if INSURANCE_BLOCK_RE.search(line):
             cur_section = "Insurance"; insurance_scope = None
@@ -2695,9 +2990,9 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         # Archivev12 Fix: Check for special field patterns BEFORE heading detection
         # to prevent them from being treated as headings
         # Phase 4 Fix: Also check for preferred contact patterns
-        is_special_sex_field = any(p.search(line) for p in SEX_GENDER_PATTERNS)
-        is_special_marital_field = any(p.search(line) for p in MARITAL_STATUS_PATTERNS)
-        is_special_preferred_contact = any(p.search(line) for p in PREFERRED_CONTACT_PATTERNS)
+        is_special_sex_field = bool(SEX_GENDER_ANY_RE.search(line))
+        is_special_marital_field = bool(MARITAL_ANY_RE.search(line))
+        is_special_preferred_contact = bool(PREFERRED_CONTACT_ANY_RE.search(line))
         is_special_field = is_special_sex_field or is_special_marital_field or is_special_preferred_contact
         
         # Fix 2: Section heading with multi-line header detection
@@ -2706,21 +3001,20 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
             # But only combine if the next line appears to be a continuation, not a new section
             potential_headers = [line]
             j = i + 1
-            while j < len(lines) and j < i + 3:  # Look ahead up to 2 lines
-                next_raw = lines[j]
-                next_line = collapse_spaced_caps(next_raw.strip())
+            while j < n_lines and j < i + 3:  # Look ahead up to 2 lines
+                next_line = collapsed[j]
                 if not next_line:
                     break
                 # Archivev12 Fix: Don't include special fields in multi-line headers
-                is_next_special_sex = any(p.search(next_line) for p in SEX_GENDER_PATTERNS)
-                is_next_special_marital = any(p.search(next_line) for p in MARITAL_STATUS_PATTERNS)
+                is_next_special_sex = bool(SEX_GENDER_ANY_RE.search(next_line))
+                is_next_special_marital = bool(MARITAL_ANY_RE.search(next_line))
                 is_next_special = is_next_special_sex or is_next_special_marital
                 
                 # Fix: Only combine if next line appears to be a continuation
                 # Don't combine if next line has "information", "practice", "consent" which are typically new sections
                 # Don't combine if next line contains field-like patterns (colons with short text)
                 # Only combine if starts with lowercase (continuation) or is very short descriptive phrase
-                has_section_keywords = re.search(r'\b(information|practice|consent|authorization|attestation|form|release)\b', next_line, re.I)
+                has_section_keywords = SECTION_KW_RE.search(next_line)
                 has_field_pattern = next_line.endswith(':') and len(next_line.split()) <= 4
                 
                 is_continuation = (
@@ -2751,24 +3045,27 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 # Archivev10 Fix: Don't override Medical/Dental History sections with "General"
                 # This prevents random headings within those sections from changing the section
                 # But DO allow changing between specific sections
-                if cur_section in {"Medical History", "Dental History"} and new_section == "General":
+                if cur_section in CONDITION_SECTIONS and new_section == "General":
                     # Keep the current specific section, don't change to General
                     pass
                 else:
                     cur_section = new_section
             
-            low = line.lower()
-            if "insurance" in low:
-                if "primary" in low: insurance_scope = "__primary"
-                elif "secondary" in low: insurance_scope = "__secondary"
+            if "insurance" in line_lower:
+                if "primary" in line_lower: insurance_scope = "__primary"
+                elif "secondary" in line_lower: insurance_scope = "__secondary"
                 else: insurance_scope = None
             else:
                 insurance_scope = None
             i += 1; continue
+
+        # Section and insurance scope are fixed for the rest of this iteration
+        in_insurance_section = "insurance" in cur_section.lower()
+        scope_suffix = insurance_scope if insurance_scope and in_insurance_section else ""
         
         # Archivev10 Fix 2: Enhanced category header detection
         # Check if this is a category header that precedes a multi-column grid
-        if i + 1 < len(lines):
+        if i + 1 < n_lines:
             next_line = lines[i + 1]
             is_cat_header = is_category_header(line, next_line)
             if debug and is_cat_header:
@@ -2776,19 +3073,19 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
             if is_cat_header:
                 # Before skipping, check if this is actually a multi-column grid header
                 # (e.g., "Appearance    Function    Habits")
-                if cur_section in {"Medical History", "Dental History"}:
+                if cur_section in CONDITION_SECTIONS:
                     # Check if line has multiple column-like parts and next line has multiple checkboxes
-                    parts = re.split(r'\s{5,}', line.strip())
-                    next_checkboxes = len(list(re.finditer(CHECKBOX_ANY, next_line)))
+                    has_columns = _has_min_columns(line)
+                    next_checkboxes = checkbox_counts[i + 1]
                     
                     if debug:
-                        print(f"  [debug] category header check: '{line[:60]}' - parts={len(parts)}, next_cb={next_checkboxes}")
+                        print(f"  [debug] category header check: '{line[:60]}' - parts={len(WIDE_GAP_RE.split(line.strip()))}, next_cb={next_checkboxes}")
                     
-                    if len(parts) >= 3 and next_checkboxes >= 3:
+                    if has_columns and next_checkboxes >= 3:
                         # This is a multi-column grid header! Try to detect and parse the grid
                         if debug:
                             print(f"  [debug] attempting multicolumn_grid detection from category header line {i}")
-                        multicolumn_grid = detect_multicolumn_checkbox_grid(lines, i, cur_section)
+                        multicolumn_grid = detect_grid_at(i, cur_section)
                         if multicolumn_grid:
                             grid_question = parse_multicolumn_checkbox_grid(lines, multicolumn_grid, debug)
                             if grid_question:
@@ -2830,7 +3127,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
 
         # Archivev8 Fix 1: Check for orphaned checkbox pattern
         # Use raw line (not collapsed) to preserve spacing
-        if has_orphaned_checkboxes(raw) and i + 1 < len(lines):
+        if checkbox_counts[i] >= 2 and has_orphaned_checkboxes(raw) and i + 1 < n_lines:
             next_line = lines[i + 1]
             orphaned_options = associate_orphaned_labels_with_checkboxes(raw, next_line)
             
@@ -2838,9 +3135,9 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 # Found orphaned labels! Create a medical conditions question
                 # Look back for a title
                 title = None
-                if i > 0 and len(lines[i-1].strip()) < 100:
-                    prev_stripped = collapse_spaced_caps(lines[i-1].strip())
-                    if prev_stripped and not re.search(CHECKBOX_ANY, prev_stripped):
+                if i > 0 and len(stripped[i-1]) < 100:
+                    prev_stripped = collapsed[i-1]
+                    if prev_stripped and not has_checkbox[i-1]:
                         title = prev_stripped.rstrip(':?.')
                 
                 if not title:
@@ -2864,22 +3161,22 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 continue
 
         # --- NEW: Medical History Multi-select block ---
-        if cur_section in {"Medical History", "Dental History"}:
-            if re.search(r"\b(have you ever had|do you have|are you taking)\b", line, re.I) and not extract_compound_yn_prompts(line):
+        if cur_section in CONDITION_SECTIONS:
+            if CONDITIONS_PROMPT_RE.search(line) and not extract_compound_yn_prompts(line):
                 main_prompt_title = line
                 options: List[Tuple[str, Optional[bool]]] = []
                 k = i + 1
-                while k < len(lines) and lines[k].strip() and not is_heading(lines[k]):
+                while k < n_lines and stripped[k] and not heading_at(k):
                     option_line = lines[k]
                     
                     # Fix 3: Skip category headers within medical blocks
-                    if k + 1 < len(lines) and is_category_header(option_line, lines[k + 1]):
+                    if k + 1 < n_lines and is_category_header(option_line, lines[k + 1]):
                         k += 1
                         continue
                     
                     # Archivev8 Fix 1: Check for orphaned checkboxes within the medical history block
-                    if has_orphaned_checkboxes(lines[k]) and k + 1 < len(lines):
-                        orphaned_opts = associate_orphaned_labels_with_checkboxes(lines[k], lines[k + 1])
+                    if checkbox_counts[k] >= 2 and has_orphaned_checkboxes(option_line) and k + 1 < n_lines:
+                        orphaned_opts = associate_orphaned_labels_with_checkboxes(option_line, lines[k + 1])
                         if orphaned_opts:
                             options.extend(orphaned_opts)
                             k += 2  # Skip both the checkbox line and label line
@@ -2925,7 +3222,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 i += 1; continue
 
         # Signature (+ optional date)
-        if "signature" in line.lower() or "signatory" in line.lower():
+        if "signature" in line_lower or "signatory" in line_lower:
             # PARITY FIX: Skip if this is just a reference to signature in a paragraph (not an actual signature field)
             # Signature fields are typically short and contain underscores or are at the end of forms
             # Skip if the line is long (>100 chars) and doesn't have underscores (likely prose)
@@ -2935,7 +3232,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 i += 1; continue
             
             # PARITY FIX: Skip lines like "Or authorized signatory" (orphaned text)
-            if line_stripped.lower().startswith('or ') and len(line_stripped) < 40:
+            if line_lower.startswith('or ') and len(line_stripped) < 40:
                 i += 1; continue
             
             # PARITY FIX: Check if this is a tab-separated signature line with name/date fields
@@ -2961,7 +3258,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 questions.append(Question("signature", line.rstrip(":"), "Signature", "signature"))
                 seen_signature = True
                 # Adjacent Date (normalized title)
-                if i + 1 < len(lines) and DATE_LABEL_RE.search(lines[i+1]):
+                if i + 1 < n_lines and DATE_LABEL_RE.search(lines[i+1]):
                     title_dt = "Date Signed"
                     questions.append(Question(slugify(title_dt), title_dt, "Signature", "date", control={"input_type":"past"}))
                     i += 1
@@ -2969,9 +3266,9 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
 
         # Archivev10 Fix 1: Try multi-column checkbox grid detection first
         # This handles grids with 3+ checkboxes per line (common in medical/dental forms)
-        if cur_section in {"Medical History", "Dental History"}:
+        if cur_section in CONDITION_SECTIONS:
             # Check if this line or upcoming lines form a multi-column checkbox grid
-            multicolumn_grid = detect_multicolumn_checkbox_grid(lines, i, cur_section)
+            multicolumn_grid = detect_grid_at(i, cur_section)
             if multicolumn_grid:
                 grid_question = parse_multicolumn_checkbox_grid(lines, multicolumn_grid, debug)
                 if grid_question:
@@ -2982,16 +3279,15 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
             
             # Also check if this is a category header line followed by a grid
             # (e.g., "Appearance    Function    Habits    Previous Comfort Options")
-            if not re.search(CHECKBOX_ANY, line):
+            if not has_checkbox[i]:
                 # Check if it looks like multiple column headers
-                parts = re.split(r'\s{5,}', line.strip())
-                if len(parts) >= 3 and all(len(p.split()) <= 4 for p in parts):
+                if _has_min_columns(line) and all(len(p.split()) <= 4 for p in WIDE_GAP_RE.split(line.strip())):
                     # Might be category headers, check if next line has multiple checkboxes
-                    if i + 1 < len(lines):
-                        next_checkboxes = len(list(re.finditer(CHECKBOX_ANY, lines[i + 1])))
+                    if i + 1 < n_lines:
+                        next_checkboxes = checkbox_counts[i + 1]
                         if next_checkboxes >= 3:
                             # This is a category header line before a grid!
-                            multicolumn_grid = detect_multicolumn_checkbox_grid(lines, i, cur_section)
+                            multicolumn_grid = detect_grid_at(i, cur_section)
                             if multicolumn_grid:
                                 grid_question = parse_multicolumn_checkbox_grid(lines, multicolumn_grid, debug)
                                 if grid_question:
@@ -3016,7 +3312,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
             ncols = len(hdr_cols)
             col_options: List[List[Tuple[str, Optional[bool]]]] = [[] for _ in range(ncols)]
             k = i + 1
-            while k < len(lines) and lines[k].strip():
+            while k < n_lines and stripped[k]:
                 row = collapse_spaced_caps(lines[k])
                 if is_heading(row): break
                 cells = chunk_by_columns(row, ncols)
@@ -3029,7 +3325,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                     else:
                         opts += options_from_inline_line(cell)
                     if not opts and ("," in cell or "/" in cell or ";" in cell):
-                        for tok in re.split(r"[,/;]", cell):
+                        for tok in cell.translate(OPTION_SEP_TRANS).split(","):
                             tok = clean_token(tok)
                             if tok: opts.append((tok, None))
                     col_options[cidx].extend(opts)
@@ -3040,8 +3336,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 options = [make_option(n,b) for (n,b) in opts]
                 control = {"options": options, "multi": True}
                 qkey = slugify(col)
-                if insurance_scope and "insurance" in cur_section.lower():
-                    qkey = f"{qkey}{insurance_scope}"
+                qkey += scope_suffix
                 questions.append(Question(qkey, col, cur_section, "dropdown", control=control))
             i = k; continue
 
@@ -3085,7 +3380,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 checkbox_title,
                 cur_section,
                 "radio",
-                control={"options": [make_option("Yes", True), make_option("No", False)]}
+                control={"options": make_yes_no_options()}
             ))
             
             if debug:
@@ -3098,9 +3393,10 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         composite_labels = try_split_known_labels(line)
         if composite_labels:
             for ttl in composite_labels:
-                if ttl.lower().startswith("state"):
+                ttl_lower = ttl.lower()
+                if ttl_lower.startswith("state"):
                     qtype, ctrl = "states", {}
-                elif "date" in ttl.lower() or "birth" in ttl.lower() or "dob" in ttl.lower():
+                elif "date" in ttl_lower or "birth" in ttl_lower or "dob" in ttl_lower:
                     qtype, ctrl = "date", {"input_type": classify_date_input(ttl)}
                 else:
                     itype = classify_input_type(ttl)
@@ -3110,8 +3406,8 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 key, qtype, ctrl = _emit_parent_guardian_override(ttl, key, qtype, ctrl, cur_section, insurance_scope, debug)
                 # insurance scoping for SSN
                 key = _insurance_scope_key(key, cur_section, insurance_scope, ttl, debug)
-                if insurance_scope and "insurance" in cur_section.lower() and not key.endswith((PRIMARY_SUFFIX, SECONDARY_SUFFIX)) and key in {"ssn","insurance_id_number"}:
-                    key = f"{key}{insurance_scope}"
+                if key in SCOPED_INSURANCE_KEYS:
+                    key += scope_suffix
                 questions.append(Question(key, ttl, cur_section, qtype, control=ctrl))
             i += 1; continue
 
@@ -3122,7 +3418,6 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
             title = clean_field_title(field_label)
             key = slugify(title)
             # Determine if radio or checkbox based on context
-            from .modules.performance_enhancements import infer_radio_vs_checkbox
             field_type = infer_radio_vs_checkbox(options, title)
             control = {"options": options}
             if field_type == "checkbox":
@@ -3136,25 +3431,24 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         if mbox and RESP_PARTY_RE.search(line):
             title = "Responsible party is someone other than patient?"
             key = slugify(title)
-            if insurance_scope and "insurance" in cur_section.lower():
-                key = f"{key}{insurance_scope}"
-            control = {"options":[make_option("Yes",True), make_option("No",False)]}
+            key += scope_suffix
+            control = {"options":make_yes_no_options()}
             questions.append(Question(key, title, "Insurance", "radio", control=control))
             if debug: print(f"  [debug] gate: bool_single_box -> '{line}' -> radio Yes/No")
             i += 1; continue
 
         # Fix 4: Check for orphaned checkboxes (enhanced)
-        if i + 1 < len(lines):
+        if i + 1 < n_lines:
             orphaned_opts = extract_orphaned_checkboxes_and_labels(line, lines[i+1])
             if orphaned_opts:
                 # Check if in medical/dental history section for condition collection
-                is_condition_block = cur_section in {"Medical History", "Dental History"}
+                is_condition_block = cur_section in CONDITION_SECTIONS
                 
                 # Try to find a better title from previous line
                 title = "Please select all that apply:"
                 if i > 0:
-                    prev_line = collapse_spaced_caps(lines[i-1].strip())
-                    if prev_line and not re.search(CHECKBOX_ANY, prev_line) and not is_heading(prev_line):
+                    prev_line = collapsed[i-1]
+                    if prev_line and not has_checkbox[i-1] and not is_heading(prev_line):
                         # Use previous line as title if it looks like a question
                         if prev_line.endswith('?') or prev_line.endswith(':') or len(prev_line) > 20:
                             title = prev_line.rstrip(':').strip()
@@ -3177,11 +3471,11 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         # Bullet -> terms (explanatory lists)
         if line.lstrip().startswith(("•","·")):
             terms_lines = [line]; k = i+1
-            while k < len(lines) and lines[k].strip() and not is_heading(lines[k]):
+            while k < n_lines and stripped[k] and not heading_at(k):
                 if lines[k].lstrip().startswith(("•","·")):
                     terms_lines.append(lines[k])
                 else:
-                    terms_lines[-1] += " " + lines[k].strip()
+                    terms_lines[-1] += " " + stripped[k]
                 k += 1
             txt_terms = " ".join(collapse_spaced_caps(x).strip() for x in terms_lines)
             questions.append(Question(
@@ -3192,29 +3486,30 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
             i = k; continue
 
         # Special: “Please share the following dates”
-        if re.search(r"please\s+share\s+the\s+following\s+dates", line, re.I):
-            harvested = " ".join(collapse_spaced_caps(lines[j].strip()) for j in range(i, min(i+3,len(lines))))
+        if "share" in line_lower and SHARE_DATES_RE.search(line):
+            harvested = " ".join(collapsed[j] for j in range(i, min(i+3,n_lines)))
             for lbl in ["Cleaning","Cancer Screening","X-Rays","X Rays","Xray"]:
                 if re.search(lbl.replace(" ", r"\s*"), harvested, re.I):
                     questions.append(Question(slugify(lbl), lbl, cur_section, "date", control={"input_type":"past"}))
             i += 1; continue
 
         # Robust 1..10 detection (pain scale etc.)
-        digits = [int(x) for x in re.findall(r"\b\d+\b", line)]
-        if digits and digits == list(range(1, 11)):
+        digit_runs = DIGIT_RUN_RE.findall(line)
+        if len(digit_runs) == 10 and [int(x) for x in digit_runs] == PAIN_SCALE_VALUES:
             title = line
             options = [{"name": str(n), "value": n} for n in range(1,11)]
             questions.append(Question(slugify(title), title, cur_section, "radio", control={"options": options}))
             i += 1; continue
 
         # Comms consent
-        if re.search(r"\bsend me\b.*\btext\b", line, re.I):
+        has_send_me = "send me" in line_lower
+        if has_send_me and SEND_TEXT_RE.search(line):
             questions.append(Question("consent_text_alerts","Consent to Text Message alerts",cur_section,"radio",
-                                      control={"options":[make_option("Yes",True),make_option("No",False)]}))
+                                      control={"options":make_yes_no_options()}))
             i += 1; continue
-        if re.search(r"\bsend me\b.*\bemail\b", line, re.I):
+        if has_send_me and SEND_EMAIL_RE.search(line):
             questions.append(Question("consent_email_alerts","Consent to Email alerts",cur_section,"radio",
-                                      control={"options":[make_option("Yes",True),make_option("No",False)]}))
+                                      control={"options":make_yes_no_options()}))
             i += 1; continue
 
         # Fix 2: Enhanced "If Yes" Detection - try new pattern first
@@ -3231,39 +3526,42 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         compound_prompts = extract_compound_yn_prompts(line)
         emitted_compound = False
         if compound_prompts:
+            # Follow-up signals depend only on this line and the next one, so they are
+            # evaluated once rather than per prompt. Every IF_GUIDANCE_RE and
+            # FOLLOWUP_PHRASE_RE alternative contains "if", "explain" or "please".
+            has_followup_cue = "if" in line_lower or "explain" in line_lower or "please" in line_lower
+            has_if_guidance = has_followup_cue and IF_GUIDANCE_RE.search(line) is not None
+            create_follow_up = (
+                has_if_guidance
+                # Check same line for "if yes, please explain"
+                or (has_followup_cue and FOLLOWUP_PHRASE_RE.search(line) is not None)
+                # Check next line for follow-up indicators
+                or (i + 1 < n_lines and FOLLOWUP_LEAD_RE.search(collapsed[i+1]) is not None)
+            )
             for ptxt in compound_prompts:
                 # Fix: Strip follow-up instructions from prompt to get clean question
                 # Pattern: "Question? If yes, please explain:______" -> "Question?"
-                clean_ptxt = re.sub(r'\s+(if\s+yes|if\s+so|please\s+explain|explain\s+below).*$', '', ptxt, flags=re.I).strip()
+                clean_ptxt = FOLLOWUP_TAIL_RE.sub('', ptxt).strip()
                 if not clean_ptxt:
                     clean_ptxt = ptxt  # Fallback if regex removes everything
                 
                 key = slugify(clean_ptxt)
-                if insurance_scope and "insurance" in cur_section.lower():
-                    key = f"{key}{insurance_scope}"
-                control = {"options":[make_option("Yes",True),make_option("No",False)]}
+                key += scope_suffix
+                control = {"options":make_yes_no_options()}
                 
                 # Fix 2: Enhanced follow-up field detection
-                create_follow_up = False
-                if re.search(IF_GUIDANCE_RE, line):
+                if has_if_guidance:
                     control["extra"] = {"type":"Input","value":True,"optional":True,"hint":"If yes, please explain"}
-                    create_follow_up = True
-                
-                # Check same line for "if yes, please explain"
-                if re.search(r'\b(if\s+yes|please\s+explain|if\s+so|explain\s+below)\b', line, re.I):
-                    create_follow_up = True
-                
-                # Check next line for follow-up indicators
-                if i + 1 < len(lines):
-                    next_line = collapse_spaced_caps(lines[i+1].strip())
-                    if re.search(r'^\s*(if\s+yes|please\s+explain|explain|comment|list|details?)', next_line, re.I):
-                        create_follow_up = True
                 
                 # Create follow-up field if needed with conditional
                 if create_follow_up:
                     follow_up_key = f"{key}_explanation"
-                    # Check if not already created
-                    if not any(q.key == follow_up_key for q in questions):
+                    # Check if not already created (questions only grows inside this
+                    # loop, so the key set is topped up with the newly emitted ones)
+                    if len(questions) > emitted_keys_synced:
+                        emitted_keys.update(q.key for q in questions[emitted_keys_synced:])
+                        emitted_keys_synced = len(questions)
+                    if follow_up_key not in emitted_keys:
                         follow_up_q = Question(
                             follow_up_key,
                             "Please explain",
@@ -3277,7 +3575,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 
                 questions.append(Question(key, clean_ptxt, cur_section, "radio", control=control))
                 emitted_compound = True
-            if re.search(r"name\s+of\s+school", line, re.I):
+            if NAME_OF_SCHOOL_RE.search(line):
                 questions.append(Question("name_of_school","Name of School",cur_section,"input",control={"input_type":"text"}))
         if emitted_compound:
             i += 1; continue
@@ -3308,7 +3606,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         
         # Archivev12 Fix 3: Special handling for Sex/Gender with text options (M or F) - LEGACY fallback
         # Keep for backward compatibility, but the new detect_inline_text_options should catch these
-        sex_match = re.search(r'\b(sex|gender)\s*[:\-]?\s*(?:M\s*or\s*F|M/F|Male/Female|Mor\s*F)', line, re.I)
+        sex_match = ("sex" in line_lower or "gender" in line_lower) and SEX_MF_RE.search(line)
         if sex_match:
             key = "sex"
             title = sex_match.group(1).title()
@@ -3325,22 +3623,25 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
             continue
         
         # Archivev12 Fix 4: Special handling for "Please Circle One:" marital status
-        marital_match = re.search(r'(?:please\s+)?circle\s+one\s*:?\s*(.*?)$', line, re.I)
+        marital_match = "circle" in line_lower and CIRCLE_ONE_RE.search(line)
         if marital_match:
             # Extract options from the rest of the line
             options_text = marital_match.group(1).strip()
             # Common marital status options
+            options_text_lower = options_text.lower()
             marital_options = []
+            marital_names = set()  # names already in marital_options
             for opt in ['Single', 'Married', 'Divorced', 'Separated', 'Widowed', 'Widow']:
-                if opt.lower() in options_text.lower():
+                if opt.lower() in options_text_lower:
                     if opt == 'Widow':
                         opt = 'Widowed'  # Normalize
-                    if opt not in [o['name'] for o in marital_options]:
+                    if opt not in marital_names:
                         marital_options.append({"name": opt, "value": opt.lower()})
+                        marital_names.add(opt)
             
             if marital_options:
                 # Add standard options if not present
-                if not any(o['name'] == 'Prefer not to say' for o in marital_options):
+                if 'Prefer not to say' not in marital_names:
                     marital_options.append({"name": "Prefer not to say", "value": "not say"})
                 
                 control = {"options": marital_options}
@@ -3354,11 +3655,14 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         opts_block: List[Tuple[str, Optional[bool]]] = []
         j = i + 1
         # collect bullets immediately below
-        while j < len(lines):
+        while j < n_lines:
+            if not stripped[j]: break
             cand = collapse_spaced_caps(lines[j])
-            if not cand.strip(): break
             o = option_from_bullet_line(cand)
             if o: opts_block.append(o); j += 1; continue
+            # Not a bullet and no checkboxes at all: no inline options either, stop here
+            if not has_checkbox[j]:
+                break
             # NEW: Also collect inline checkbox options from following lines (Fix 1 enhancement)
             inline_opts = options_from_inline_line(cand)
             if inline_opts:  # Any checkboxes found
@@ -3374,7 +3678,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                     # Has label if: contains colon OR has meaningful text (3+ chars, not just numbers/symbols)
                     if ':' in text_before_bracket:
                         line_has_own_label = True
-                    elif len(text_before_bracket) >= 3 and re.search(r'[A-Za-z]{3,}', text_before_bracket):
+                    elif len(text_before_bracket) >= 3 and ALPHA_WORD_RE.search(text_before_bracket):
                         # Has at least 3 letters in a row (meaningful word), likely a label
                         line_has_own_label = True
                 
@@ -3394,9 +3698,6 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                     opts_block.extend(inline_opts)
                     j += 1
                     continue
-            # No valid options found on this line - check if it's a continuation or break
-            if not re.search(CHECKBOX_ANY, cand):  # No checkboxes at all
-                break
             # Has checkboxes but no valid labels - might be orphaned checkboxes, continue
             j += 1
             continue
@@ -3405,10 +3706,10 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         is_hear = bool(HEAR_ABOUT_RE.search(title))
         
         # Fix 1: If current line starts with checkbox and we have opts_block, look back for title
-        if opts_block and re.match(r'^\s*' + CHECKBOX_ANY, line):
+        if opts_block and starts_with_checkbox(line):
             if i > 0:
-                prev_line = collapse_spaced_caps(lines[i-1].strip())
-                if prev_line and not re.search(CHECKBOX_ANY, prev_line) and not is_heading(prev_line):
+                prev_line = collapsed[i-1]
+                if prev_line and not has_checkbox[i-1] and not is_heading(prev_line):
                     title = prev_line.rstrip(':').strip()
                     is_hear = bool(HEAR_ABOUT_RE.search(title))
 
@@ -3416,12 +3717,10 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         if is_hear and not (opts_inline or opts_block):
             # Fix 1: Check if next line has inline checkboxes - if so, skip and let next line handle it
             # Fix 1: Check if next line(s) have inline checkboxes - skip blanks
-            check_idx = i + 1
-            while check_idx < len(lines) and not lines[check_idx].strip():
-                check_idx += 1  # Skip blank lines
-            if check_idx < len(lines):
-                next_line_check = lines[check_idx].strip()
-                if next_line_check and re.search(CHECKBOX_ANY, next_line_check):
+            check_idx = next_nonblank[i]  # Skip blank lines
+            if check_idx < n_lines:
+                next_line_check = stripped[check_idx]
+                if next_line_check and has_checkbox[check_idx]:
                     next_opts_check = options_from_inline_line(next_line_check)
                     if len(next_opts_check) >= 2:
                         # Next line will handle this, skip for now
@@ -3429,19 +3728,19 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                         continue
             
             # same line split
-            for tok in re.split(r"[,/;]", title):
+            for tok in title.translate(OPTION_SEP_TRANS).split(","):
                 tok = clean_token(tok)
                 if tok and tok.lower() not in {"how did you hear about us", "referred by"}:
                     opts_inline.append((tok, None))
             k = i + 1
             extra_lines = 0
-            while k < len(lines) and extra_lines < 2:
+            while k < n_lines and extra_lines < 2:
                 cand = collapse_spaced_caps(lines[k]).strip()
                 if not cand or is_heading(cand): break
                 ob = option_from_bullet_line(cand)
                 if ob:
                     opts_block.append(ob); k += 1; continue
-                for tok in re.split(r"[,/;]", cand):
+                for tok in cand.translate(OPTION_SEP_TRANS).split(","):
                     tok = clean_token(tok)
                     if tok: opts_block.append((tok, None))
                 k += 1; extra_lines += 1
@@ -3456,21 +3755,13 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 print(f"  [debug]   Keys: {[k for k, _ in multiple_label_fields]}")
             for field_key, field_title in multiple_label_fields:
                 # Determine input type based on field name
-                input_type = "text"
-                if "phone" in field_key.lower():
-                    input_type = "phone"
-                elif "email" in field_key.lower():
-                    input_type = "email"
-                elif "zip" in field_key.lower() or field_key.lower() == "zip":
-                    input_type = "zip"
-                elif "ssn" in field_key.lower() or field_key.lower() in ["ss", "social_security"]:
-                    input_type = "ssn"
-                elif field_key.lower() in ["state", "st"]:
+                input_type = multi_label_field_type(field_key)
+                if input_type == "states":
                     # Create a states field instead
                     questions.append(Question(field_key, field_title, cur_section, "states",
                                             control={"hint": "Select state..."}))
                     continue
-                elif "date" in field_key.lower() or "dob" in field_key.lower() or field_key.lower() == "birth":
+                if input_type == "date":
                     # Create a date field
                     questions.append(Question(field_key, field_title, cur_section, "date",
                                             control={"input_type": "past"}))
@@ -3490,17 +3781,18 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 print(f"  [debug]   Keys: {[k for k, _ in space_sep_fields]}")
             for field_key, field_title in space_sep_fields:
                 # Determine field type based on title
-                if 'signature' in field_key.lower():
+                key_lower = field_key.lower()
+                if 'signature' in key_lower:
                     questions.append(Question(field_key, field_title, cur_section, "block_signature",
                                             control={"language": "en", "variant": "adult_no_guardian_details"}))
-                elif 'date' in field_key.lower():
+                elif 'date' in key_lower:
                     questions.append(Question(field_key, field_title, cur_section, "date",
                                             control={"input_type": "past"}))
-                elif 'name' in field_key.lower() and 'print' in field_key.lower():
+                elif 'name' in key_lower and 'print' in key_lower:
                     # "Name (Print)" or "Printed Name"
                     questions.append(Question(field_key, field_title, cur_section, "input",
                                             control={"hint": None, "input_type": "name"}))
-                elif 'witness' in field_key.lower():
+                elif 'witness' in key_lower:
                     questions.append(Question(field_key, field_title, cur_section, "input",
                                             control={"hint": None, "input_type": "name"}))
                 else:
@@ -3532,7 +3824,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         
         # PARITY FIX: Check for multi-blank lines with labels on following line
         # Handles signature blocks where blanks are vertically aligned above column labels
-        next_lines_for_blanks = lines[i+1:min(i+4, len(lines))]  # Look ahead 3 lines
+        next_lines_for_blanks = lines[i+1:min(i+4, n_lines)]  # Look ahead 3 lines
         multi_blank_fields = detect_multi_blank_line_with_labels(line, next_lines_for_blanks)
         if multi_blank_fields:
             if debug:
@@ -3540,16 +3832,17 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 print(f"  [debug]   Keys: {[k for k, _ in multi_blank_fields]}")
             for field_key, field_title in multi_blank_fields:
                 # Determine field type based on title
-                if 'signature' in field_key.lower():
+                key_lower = field_key.lower()
+                if 'signature' in key_lower:
                     questions.append(Question(field_key, field_title, cur_section, "block_signature",
                                             control={"language": "en", "variant": "adult_no_guardian_details"}))
-                elif 'date' in field_key.lower():
+                elif 'date' in key_lower:
                     questions.append(Question(field_key, field_title, cur_section, "date",
                                             control={"input_type": "past"}))
-                elif 'name' in field_key.lower() and 'print' in field_key.lower():
+                elif 'name' in key_lower and 'print' in key_lower:
                     questions.append(Question(field_key, field_title, cur_section, "input",
                                             control={"hint": None, "input_type": "name"}))
-                elif 'witness' in field_key.lower():
+                elif 'witness' in key_lower:
                     questions.append(Question(field_key, field_title, cur_section, "input",
                                             control={"hint": None, "input_type": "name"}))
                 else:
@@ -3560,7 +3853,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         
         # Category 1 Fix 1.2: Check for fill-in-blank fields
         prev_line_text = lines[i-1] if i > 0 else None
-        next_line_text = lines[i+1] if i+1 < len(lines) else None
+        next_line_text = lines[i+1] if i+1 < n_lines else None
         fill_in_blank = detect_fill_in_blank_field(line, prev_line_text, next_line_text)
         if fill_in_blank:
             field_key, field_title = fill_in_blank
@@ -3568,13 +3861,14 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 print(f"  [debug] fill-in-blank detected: {line[:60]}... -> {field_key}")
             
             # Determine field type based on the title
-            if 'signature' in field_title.lower():
+            title_lower = field_title.lower()
+            if 'signature' in title_lower:
                 questions.append(Question(field_key, field_title, cur_section, "block_signature",
                                         control={"language": "en", "variant": "adult_no_guardian_details"}))
-            elif 'date' in field_title.lower():
+            elif 'date' in title_lower:
                 questions.append(Question(field_key, field_title, cur_section, "date",
                                         control={"input_type": "past"}))
-            elif 'name' in field_title.lower():
+            elif 'name' in title_lower:
                 questions.append(Question(field_key, field_title, cur_section, "input",
                                         control={"hint": None, "input_type": "name"}))
             else:
@@ -3614,26 +3908,25 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 print(f"  [debug] inline checkbox with text: {line[:60]}... -> {field_key}")
             # Create a boolean/radio field with the option and description
             questions.append(Question(field_key, field_title, cur_section, field_type,
-                                      control={"options": [make_option("Yes", True), make_option("No", False)]}))
+                                      control={"options": make_yes_no_options()}))
             i += 1
             continue
 
         # Simple labeled fields
         if STATE_LABEL_RE.match(title):
             key = slugify(title or "state")
-            if insurance_scope and "insurance" in cur_section.lower(): key = f"{key}{insurance_scope}"
+            key += scope_suffix
             questions.append(Question(key, title or "State", cur_section, "states", control={}))
             i += 1; continue
 
         # Production readiness: Remove trailing underscores before date detection
-        title_for_check = re.sub(r'_+$', '', title).strip()
+        title_for_check = TRAILING_UNDERSCORES_RE.sub('', title).strip()
         if DATE_LABEL_RE.search(title_for_check):
             # Improvement 6: Use contextual date key instead of generic slugify
             prev_context = lines[max(0, i-3):i] if i > 0 else []
             key = generate_contextual_date_key(title or "date", prev_context, cur_section)
             
-            if insurance_scope and "insurance" in cur_section.lower(): 
-                key = f"{key}{insurance_scope}"
+            key += scope_suffix
             # Archivev18 Fix 1: Clean date field titles to remove template artifacts
             clean_title = clean_field_title(title) if title else "Date"
             questions.append(Question(key, clean_title, cur_section, "date",
@@ -3668,18 +3961,16 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                     clean_title = extracted_title
                 else:
                     # Title likely includes the options. Look back for a better title (skip blank lines).
-                    lookback_idx = i - 1
-                    while lookback_idx >= 0 and not lines[lookback_idx].strip():
-                        lookback_idx -= 1  # Skip blank lines
+                    lookback_idx = prev_nonblank[i]  # Skip blank lines
                     if lookback_idx >= 0:
-                        prev_line = collapse_spaced_caps(lines[lookback_idx].strip())
-                        if prev_line and not re.search(CHECKBOX_ANY, prev_line) and not is_heading(prev_line):
+                        prev_line = collapsed[lookback_idx]
+                        if prev_line and not has_checkbox[lookback_idx] and not is_heading(prev_line):
                             # Use previous line if it looks like a question/prompt
                             if len(prev_line) >= 5:
                                 clean_title = prev_line.rstrip(':').strip()
             
             # If title still has checkbox markers, try to extract clean text
-            if re.search(CHECKBOX_ANY, clean_title):
+            if has_checkbox_token(clean_title):
                 extracted = extract_title_from_inline_checkboxes(clean_title)
                 # Archivev12 Fix: Allow short field names like "Sex", "Age"
                 if extracted and len(extracted) >= 2:
@@ -3687,8 +3978,8 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                 else:
                     # Couldn't extract - fallback to looking back or generic title
                     if i > 0 and clean_title == title:  # Haven't already looked back
-                        prev_line = collapse_spaced_caps(lines[i-1].strip())
-                        if prev_line and not re.search(CHECKBOX_ANY, prev_line) and not is_heading(prev_line):
+                        prev_line = collapsed[i-1]
+                        if prev_line and not has_checkbox[i-1] and not is_heading(prev_line):
                             clean_title = prev_line.rstrip(':').strip()
                         else:
                             clean_title = "Please select"
@@ -3700,24 +3991,24 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
             
             lowset = {n.lower() for (n,_b) in collected}
             if {"yes","no"} <= lowset or lowset <= YESNO_SET:
-                control = {"options":[make_option("Yes",True), make_option("No",False)]}
-                if re.search(IF_GUIDANCE_RE, cleaned_question_title):
+                control = {"options":make_yes_no_options()}
+                if IF_GUIDANCE_RE.search(cleaned_question_title):
                     control["extra"] = {"type":"Input","value":True,"optional":True,"hint":"If yes, please explain"}
                     # --- Fix 2: Add separate input for "if yes" (enhanced) ---
-                    if j < len(lines):
-                        next_line = collapse_spaced_caps(lines[j].strip())
-                        if re.search(r"\b(list|explain|if so|name of)\b", next_line, re.I):
+                    if j < n_lines:
+                        next_line = collapsed[j]
+                        if FOLLOWUP_HINT_RE.search(next_line):
                             follow_up_title = f"{cleaned_question_title} - Details"
                             follow_up_key = slugify(follow_up_title)
                             questions.append(Question(follow_up_key, follow_up_title, cur_section, "input", control={"input_type": "text"}))
                 key = slugify(cleaned_question_title)
-                if insurance_scope and "insurance" in cur_section.lower(): key = f"{key}{insurance_scope}"
+                key += scope_suffix
                 questions.append(Question(key, cleaned_question_title, cur_section, "radio", control=control))
             else:
                 make_radio = bool(SINGLE_SELECT_TITLES_RE.search(cleaned_question_title))
                 options = [make_option(n, b) for (n,b) in collected]
                 if not options and ("," in cleaned_question_title or "/" in cleaned_question_title or ";" in cleaned_question_title):
-                    for tok in re.split(r"[,/;]", cleaned_question_title):
+                    for tok in cleaned_question_title.translate(OPTION_SEP_TRANS).split(","):
                         tok = clean_token(tok)
                         if tok: options.append(make_option(tok, None))
                 
@@ -3732,10 +4023,10 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
                     control["multi"] = True
                 if is_hear:
                     control["extra"] = {"type":"Input","value":True,"optional":True,"hint":"Other (please specify)"}
-                    if (REFERRED_BY_RE.search(cleaned_question_title) or (j < len(lines) and REFERRED_BY_RE.search(lines[j]))):
+                    if (REFERRED_BY_RE.search(cleaned_question_title) or (j < n_lines and REFERRED_BY_RE.search(lines[j]))):
                         questions.append(Question("referred_by","Referred by",cur_section,"input",control={"input_type":"text"}))
                 key = slugify(cleaned_question_title)
-                if insurance_scope and "insurance" in cur_section.lower(): key = f"{key}{insurance_scope}"
+                key += scope_suffix
                 qtype = "radio" if make_radio else "dropdown"
                 questions.append(Question(key, cleaned_question_title, cur_section, qtype, control=control))
             i = j if not opts_inline else i + 1
@@ -3743,27 +4034,18 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
 
         # Long paragraph → terms
         # First check if the current line is a known field label - if so, don't treat as paragraph
-        current_line_is_field_label = False
-        for field_key, pattern in KNOWN_FIELD_LABELS.items():
-            if re.search(pattern, line, re.I):
-                current_line_is_field_label = True
-                break
+        current_line_is_field_label = KNOWN_FIELD_LABEL_RE.search(line) is not None
         
         if not current_line_is_field_label:
             para = [lines[i]]; k = i+1
-            while k < len(lines) and lines[k].strip() and not BULLET_RE.match(lines[k].strip()):
-                if is_heading(lines[k]): break
+            while k < n_lines and stripped[k] and not BULLET_RE.match(stripped[k]):
+                if heading_at(k): break
                 # Stop collecting if we hit a yes/no question pattern (don't include these in terms)
                 if extract_compound_yn_prompts(lines[k]):
                     break
                 # Don't absorb lines that look like field labels (e.g., "Patient Name:", "Date of Birth:")
                 # Check if line matches known field label patterns
-                line_matches_field_label = False
-                for field_key, pattern in KNOWN_FIELD_LABELS.items():
-                    if re.search(pattern, lines[k], re.I):
-                        line_matches_field_label = True
-                        break
-                if line_matches_field_label:
+                if KNOWN_FIELD_LABEL_RE.search(lines[k]):
                     break
                 para.append(lines[k]); k += 1
             joined = " ".join(collapse_spaced_caps(x).strip() for x in para)
@@ -3792,9 +4074,9 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         # Default: input
         # Fix 1: Skip if next line has inline options that will use this as title
         # BUT only if the next line doesn't have its own label (e.g., "Label: [ ] options")
-        if i + 1 < len(lines):
-            next_line = lines[i + 1].strip()
-            if next_line and re.search(CHECKBOX_ANY, next_line):
+        if i + 1 < n_lines:
+            next_line = stripped[i + 1]
+            if next_line and has_checkbox[i + 1]:
                 # Check if next line has inline options
                 next_opts = options_from_inline_line(next_line)
                 if len(next_opts) >= 2:
@@ -3813,23 +4095,43 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         # Examples: "3138 N Lincoln Ave Chicago, IL", "60657", "Chicago, IL 60632"
         # Archivev22 Enhancement: Also skip document titles and section headers that slipped through
         # Archivev23 Enhancement: Skip sentence fragments, noise, and non-field questions
-        skip_patterns = [
-            r'^\d{5}$',  # Just a zip code
-            r'^\d+\s+[NS]?\s*\w+\s+(Ave|Avenue|Rd|Road|St|Street|Blvd|Boulevard)\b',  # Street address
-            r',\s*[A-Z]{2}\s+\d{5}$',  # City, State Zip
-            r'^\d+[A-Z]?\s+S\s+\w+\s+(Ave|Rd|St|Blvd)',  # Address starting with number
-            r'\w+\s*\.\s*(com|org|net|us|info|dental)\b',  # Website domain (with optional space before dot)
-            r'^\d{3}[-.]\d{3}[-.]\d{4}$',  # Phone number (standalone)
-            r'\b\d{3}[-.]\d{3}[-.]\d{4}\b',  # Phone number anywhere in text
-            r'@\s*\w+\s*\.\s*\w+',  # Email address (with optional spaces)
-            r'\(pg\.\s*\d+\)',  # Page number reference
-            r'^please\s+(ensure|note|read|remember)',  # Instructions
-            r'^[*]+',  # Lines starting with asterisks (often instructions)
-            r'^[=|]+\s*\w{1,3}\s*[=|]+$',  # Symbol noise like "= ie |"
-            r'^\([A-Z]{2,}\s+[A-Za-z\s]+\)$',  # Parenthetical codes like "(CF Gingivectomy)"
-            r'^within\s+[-\d]+\s+(days?|hours?|weeks?)',  # Time references like "within -5 days"
-        ]
-        should_skip = any(re.search(pattern, title, re.I) for pattern in skip_patterns)
+        # Case-folded and split forms shared by the skip checks below
+        title_lower = title.lower()
+        title_words = title.split()
+        n_title_words = len(title_words)
+        first = title[:1]
+        prefix_skips = SKIP_TITLE_PREFIX_PATTERNS.get("0" if first.isdecimal() else first.lower(), ())
+        should_skip = (any(p.match(title) for p in prefix_skips)
+                       or (any(c in title for c in SKIP_TITLE_CUE_CHARS)
+                           and any(p.search(title) for p in SKIP_TITLE_PATTERNS)))
+        
+        # The remaining checks run cheapest / most frequently hit first: sentence
+        # fragments and long comma lists are plain string tests and account for most
+        # default-input skips, so later checks rarely run on titles already skipped.
+        # Archivev23 Enhancement: Skip sentence fragments that end with a period but aren't questions
+        # (e.g., "healthy gums tissue.", "It is carried out to provide...")
+        # Field labels typically DON'T end with periods unless they're questions or abbreviations
+        if not should_skip and title.endswith('.'):
+            # Check if this is NOT a question and NOT an abbreviation
+            is_question = '?' in title
+            is_abbreviation = len(title) <= 10 and title.count('.') == 1
+            # Known field-like patterns that can end with period
+            is_field_pattern = any(pattern in title_lower for pattern in ['dr.', 'mr.', 'mrs.', 'ms.', 'inc.', 'ltd.'])
+            
+            if not is_question and not is_abbreviation and not is_field_pattern:
+                # This looks like a sentence fragment or complete sentence, not a field label
+                word_count = n_title_words
+                # Sentence fragments are typically 3+ words ending with period
+                if word_count >= 3:
+                    should_skip = True
+                    if debug: print(f"  [debug] skipping sentence fragment: '{title[:60]}'")
+        
+        # Archivev22 Enhancement: Skip lines that look like section headers describing content
+        # (e.g., "Endodontic (Root Canal) Treatment, Endodontic Surgery, Anesthetics, and Medications")
+        if not should_skip and len(title) > 60 and title.count(',') >= 2:
+            # Long lines with multiple commas are likely descriptive headers, not field labels
+            should_skip = True
+            if debug: print(f"  [debug] skipping descriptive header: '{title[:60]}'")
         
         # Parity Fix: Skip numbered consent section headings (e.g., "1. Reduction of tooth structure")
         # These are descriptive headings in consent forms, not fillable fields
@@ -3837,12 +4139,12 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         if not should_skip:
             # Pattern: starts with digit, period, space, then capitalized text
             # Examples: "1. Numbness following use of anesthesia", "3. Sensitivity of teeth"
-            numbered_heading_match = re.match(r'^\d+\.\s+[A-Z]', title)
+            numbered_heading_match = NUMBERED_HEADING_RE.match(title)
             if numbered_heading_match:
                 # Additional check: verify this looks like a consent/informational heading
                 # (not a numbered question like "1. Patient Name" which would have a colon or be very short)
                 has_colon = ':' in title
-                is_short = len(title.split()) <= 3
+                is_short = n_title_words <= 3
                 # Skip if it's a longer numbered heading without colon (consent section pattern)
                 if not has_colon and not is_short and len(title) > 10:
                     should_skip = True
@@ -3854,46 +4156,23 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         if not should_skip:
             # Pattern: starts with bullet symbol (●, •, ·, -, *) followed by descriptive text
             # Common in risk/complication lists
-            bullet_risk_match = re.match(r'^[●•·\-\*]\s+', title)
+            bullet_risk_match = BULLET_ITEM_RE.match(title)
             if bullet_risk_match:
                 # Check if it's a risk/complication description (not a checkbox option)
-                risk_keywords = ['risk', 'complication', 'may', 'can', 'possible', 'potential',
-                                'numbness', 'infection', 'swelling', 'pain', 'sensitivity',
-                                'bleeding', 'reaction', 'damage', 'fracture', 'decay',
-                                'temporary', 'permanent', 'post', 'treatment', 'procedure']
-                has_risk_keywords = any(kw in title.lower() for kw in risk_keywords)
+                has_risk_keywords = any(kw in title_lower for kw in BULLET_RISK_KEYWORDS)
                 # Also skip if it's a single word/short phrase (likely a condition name)
-                is_short_item = len(title.split()) <= 4
+                is_short_item = n_title_words <= 4
                 if has_risk_keywords or is_short_item:
                     should_skip = True
                     if debug: print(f"  [debug] skipping bullet risk description: '{title[:60]}'")
         
-        # Archivev23 Enhancement: Skip sentence fragments that end with a period but aren't questions
-        # (e.g., "healthy gums tissue.", "It is carried out to provide...")
-        # Field labels typically DON'T end with periods unless they're questions or abbreviations
-        if not should_skip and title.endswith('.'):
-            # Check if this is NOT a question and NOT an abbreviation
-            is_question = '?' in title
-            is_abbreviation = len(title) <= 10 and title.count('.') == 1
-            # Known field-like patterns that can end with period
-            is_field_pattern = any(pattern in title.lower() for pattern in ['dr.', 'mr.', 'mrs.', 'ms.', 'inc.', 'ltd.'])
-            
-            if not is_question and not is_abbreviation and not is_field_pattern:
-                # This looks like a sentence fragment or complete sentence, not a field label
-                word_count = len(title.split())
-                # Sentence fragments are typically 3+ words ending with period
-                if word_count >= 3:
-                    should_skip = True
-                    if debug: print(f"  [debug] skipping sentence fragment: '{title[:60]}'")
-        
         # Archivev23 Fix: Skip malformed merged field labels (extraction artifacts)
         # These have pattern: "Word1 Word2 Label:" indicating truncated first field + second field
         # Example: "Male Female Marital Status:" (Gender was already extracted)
         if not should_skip:
             # Check for pattern: words followed by capitalized Label followed by colon
             # But NOT if the first part looks like a complete field (e.g., has its own colon)
-            words = title.split()
-            if len(words) >= 3 and ':' in title:
+            if n_title_words >= 3 and ':' in title:
                 # Find position of last colon
                 last_colon_pos = title.rfind(':')
                 before_colon = title[:last_colon_pos].strip()
@@ -3917,14 +4196,7 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         # Section heading questions typically ask about topics, not patient status
         if not should_skip and '?' in title:
             # Common section heading question patterns
-            heading_question_patterns = [
-                r'^what\s+(are|is)\s+the\s+(risks?|benefits?|alternatives?|procedures?|options?)',
-                r'^how\s+(does|do|will|can)\s+(the|this|it)',
-                r'^why\s+(is|do|does|would)',
-                r'^when\s+(should|will|can)',
-                r'^who\s+(should|will|can|is)',
-            ]
-            is_heading_question = any(re.match(pattern, title.lower()) for pattern in heading_question_patterns)
+            is_heading_question = HEADING_QUESTION_RE.match(title_lower) is not None
             
             if is_heading_question:
                 should_skip = True
@@ -3934,37 +4206,28 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         # (e.g., "ENDODONTIC INFORMATION AND CONSENT FORM", "Informed Consent for Tooth Extraction")
         # Archivev23 Fix: Relax title case requirement - accept any capitalized title with form keywords
         # Parity Fix: Also handle 3-word titles like "Endodontic Informed Consent"
-        if not should_skip and len(title.split()) >= 3:
-            title_lower = title.lower()
+        if not should_skip and n_title_words >= 3:
             # Check for form title keywords
-            has_form_keywords = any(kw in title_lower for kw in ['consent', 'form', 'information', 'agreement', 'authorization', 'release', 'disclosure'])
+            has_form_keywords = any(kw in title_lower for kw in FORM_TITLE_KEYWORDS)
             # Check if it looks like a title (first letter capitalized, multiple capitalized words)
-            words = title.split()
-            capitalized_words = sum(1 for w in words if w and w[0].isupper())
+            capitalized_words = sum(1 for w in title_words if w and w[0].isupper())
             # Relaxed: 2+ capitalized words OR title case OR all caps
             looks_like_title = capitalized_words >= 2 or title.istitle() or title.isupper()
             
             # For 3-word titles, require stronger signal (e.g., "Informed Consent")
-            if len(words) == 3:
+            if n_title_words == 3:
                 # Common 3-word consent patterns
                 consent_patterns = ['informed consent', 'consent form', 'patient consent', 'consent agreement']
                 has_consent_pattern = any(pattern in title_lower for pattern in consent_patterns)
                 if has_form_keywords and has_consent_pattern and looks_like_title:
                     should_skip = True
                     if debug: print(f"  [debug] skipping document title: '{title[:60]}'")
-            elif len(words) >= 4:
+            elif n_title_words >= 4:
                 # 4+ word titles with form keywords
                 if has_form_keywords and looks_like_title:
                     should_skip = True
                     if debug: print(f"  [debug] skipping document title: '{title[:60]}'")
         
-        # Archivev22 Enhancement: Skip lines that look like section headers describing content
-        # (e.g., "Endodontic (Root Canal) Treatment, Endodontic Surgery, Anesthetics, and Medications")
-        if not should_skip and len(title) > 60 and title.count(',') >= 2:
-            # Long lines with multiple commas are likely descriptive headers, not field labels
-            should_skip = True
-            if debug: print(f"  [debug] skipping descriptive header: '{title[:60]}'")
-        
         if should_skip:
             i += 1
             continue
@@ -3977,13 +4240,13 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         key, qtype, ctrl = _emit_parent_guardian_override(cleaned_title, key, "input", {"input_type": itype} if itype else {}, cur_section, insurance_scope, debug)
         # employer patient-first: only map to insurance_employer if insurance context tokens are present
         if key == "employer":
-            if "insurance" in cur_section.lower() or re.search(r"\b(insured|subscriber|policy|member|insurance)\b", cleaned_title.lower()):
+            if in_insurance_section or INSURANCE_TERM_RE.search(cleaned_title.lower()):
                 pass  # allow later dictionary to map to insurance_employer if template title says so
             else:
                 if debug: print(f"  [debug] gate: employer_patient_first -> '{cleaned_title}' -> employer (patient)")
         key = _insurance_scope_key(key, cur_section, insurance_scope, cleaned_title, debug)
-        if insurance_scope and "insurance" in cur_section.lower() and not key.endswith((PRIMARY_SUFFIX, SECONDARY_SUFFIX)) and key in {"ssn","insurance_id_number"}:
-            key = f"{key}{insurance_scope}"
+        if key in SCOPED_INSURANCE_KEYS:
+            key += scope_suffix
         questions.append(Question(key, cleaned_title, cur_section, qtype, control=ctrl))
         i += 1
 
@@ -4002,62 +4265,25 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
         if original_text.startswith(('●', '•', '·')):
             # These are typically risk descriptions, not fillable fields
             # Look for keywords common in risk/complication lists
-            risk_keywords = [
-                'adverse', 'reaction', 'numbness', 'tingling', 'bleeding', 'infection',
-                'swelling', 'fracture', 'damage', 'injury', 'pain', 'sensitivity',
-                'complication', 'risk', 'temporary', 'permanent', 'may result', 'may cause',
-                'can lead', 'potential', 'possible', 'delayed healing', 'post-operative',
-                'post treatment', 'involving', 'involvement'
-            ]
-            if any(keyword in text_lower for keyword in risk_keywords):
+            if RISK_KEYWORD_RE.search(text_lower):
                 return True
         
         # Check for common instructional phrases
-        instructional_phrases = [
-            "thank you for",
-            "medication that you may be taking",
-            "could have an important",
-            "interrelationship with",
-            "health problems that you may have",
-            "please read",
-            "please ensure",
-            "please note",
-            "i understand that providing incorrect",
-            "to the best of my knowledge",
-            "the questions on this form have been",
-            "accurately answered",
-            "providing incorrect information can be",
-            "although dental professionals",
-            "your mouth is a part of",
-            "have been explained to me",
-            "i understand that",
-            "these treatments include",
-            "alternative methods",
-            "risks and complications",
-            "may include (but",
-            "are not limited to",
-            "has performed a thorough examination",
-            "has determined that",
-        ]
-        
-        if any(phrase in text_lower for phrase in instructional_phrases):
+        if INSTRUCTIONAL_PHRASE_RE.search(text_lower):
             return True
         
         # If text is very long (>120 chars) and contains connecting phrases, likely instructional
         if len(text) > 120:
-            connecting_phrases = [" that you ", " which ", " could ", " should ", " would ", " may ", " can "]
-            if any(phrase in text_lower for phrase in connecting_phrases):
+            if any(phrase in text_lower for phrase in CONNECTING_PHRASES):
                 return True
         
         # Check for document titles (all caps or title case, contains form keywords)
         if len(original_text.split()) >= 4:
             is_title_case = original_text.istitle() or original_text.isupper()
-            title_keywords = ['consent', 'form', 'information', 'agreement', 'authorization', 'release', 'disclosure']
-            has_form_keywords = any(keyword in text_lower for keyword in title_keywords)
+            has_form_keywords = any(keyword in text_lower for keyword in FORM_TITLE_KEYWORDS)
             
             # Also check for common section header patterns
-            section_keywords = ['risks', 'benefits', 'alternatives', 'procedures', 'treatment']
-            has_section_keywords = any(keyword in text_lower for keyword in section_keywords)
+            has_section_keywords = any(keyword in text_lower for keyword in SECTION_TOPIC_KEYWORDS)
             
             if is_title_case and (has_form_keywords or has_section_keywords):
                 return True
@@ -4072,16 +4298,16 @@ def parse_to_questions(text: str, debug: bool=False) -> List[Question]:
     def is_junk(q: Question) -> bool:
         t = q.title.strip().lower()
         return (q.key == "q" or len(q.title.strip()) <= 1 or
-                t in {"<<<", ">>>", "-", "—", "continued on back side"} or
+                t in JUNK_TITLES or
                 is_instructional_text(q.title))
-    questions = [q for q in questions if not is_junk(q)]
-    questions = [q for q in questions if not WITNESS_RE.search(q.title)]
+    questions = [q for q in questions if not is_junk(q) and not WITNESS_RE.search(q.title)]
 
     sig_idxs = [idx for idx,q in enumerate(questions) if q.type=="signature"]
     if not sig_idxs:
         questions.append(Question("signature","Signature","Signature","signature"))
     elif len(sig_idxs) > 1:
-        for idx in reversed(sig_idxs[1:]): questions.pop(idx)
+        drop = set(sig_idxs[1:])
+        questions = [q for idx,q in enumerate(questions) if idx not in drop]
 
     return questions
 
@@ -4103,6 +4329,8 @@ def ensure_control_present(q: Question) -> None:
         q.control.setdefault("agree_text","I have read and agree to the terms.")
         q.control.setdefault("html_text","")
 
+YES_NO_OPTION_VALUES = {"yes": True, "no": False}
+
 def fill_missing_option_values(q: Question) -> None:
     if q.type not in ("radio","dropdown"): return
     opts = q.control.get("options") or []
@@ -4111,10 +4339,9 @@ def fill_missing_option_values(q: Question) -> None:
         name = (opt.get("name") or "").strip() or "Option"
         val  = opt.get("value")
         if val in (None, ""):
-            vlow = name.strip().lower()
-            if vlow == "yes": val = True
-            elif vlow == "no": val = False
-            else: val = slugify(name, 80)
+            # name is already stripped; slugify is memoized for the other names
+            val = YES_NO_OPTION_VALUES.get(name.lower())
+            if val is None: val = slugify(name, 80)
         fixed.append({"name": name, "value": val})
     q.control["options"] = fixed
 
@@ -4124,17 +4351,19 @@ def _semantic_dedupe(payload: List[dict]) -> List[dict]:
     
     Archivev8 Fix 3: Skip deduplication for conditional fields (they can have same title).
     """
-    seen: Set[Tuple[str,str,str,str]] = set()
+    seen: Set[Tuple[str,str,str]] = set()  # (title, section, input_type); type is always "input"
     out: List[dict] = []
     for q in payload:
         if q.get("type") == "input":
             # Archivev8 Fix 3: Don't dedupe conditional fields
-            if q.get("if") or "conditional" in q.get("key", "").lower() or "_explanation" in q.get("key", "").lower():
+            key_lower = q.get("key", "").lower()
+            if q.get("if") or "conditional" in key_lower or "_explanation" in key_lower:
                 out.append(q)
                 continue
             
-            itype = (q.get("control") or {}).get("input_type","text")
-            sig = (q.get("title","").strip().lower(), q.get("section",""), "input", itype)
+            ctrl = q.get("control")
+            itype = ctrl.get("input_type","text") if ctrl else "text"
+            sig = (q.get("title","").strip().lower(), q.get("section",""), itype)
             if sig in seen:
                 continue
             seen.add(sig)
@@ -4153,12 +4382,9 @@ def dedupe_keys(questions: List[Question]) -> None:
         base = "signature" if q.type=="signature" else (q.key or "q")
         if q.type=="signature":
             q.key = "signature"
-        elif base not in seen:
-            seen[base]=1
-            q.key=base
         else:
-            seen[base]+=1
-            q.key=f"{base}_{seen[base]}"
+            count = seen[base] = seen.get(base, 0) + 1
+            q.key = base if count == 1 else f"{base}_{count}"
         
         # Handle nested questions in multiradio controls
         if q.type == "multiradio" and q.control and "questions" in q.control:
@@ -4170,31 +4396,29 @@ def dedupe_keys(questions: List[Question]) -> None:
                 # Process nested question if it's a dict
                 elif isinstance(nested_q, dict):
                     nested_key = nested_q.get("key", "q")
-                    if nested_key in seen:
-                        seen[nested_key] += 1
-                        nested_q["key"] = f"{nested_key}_{seen[nested_key]}"
-                    else:
-                        seen[nested_key] = 1
+                    count = seen[nested_key] = seen.get(nested_key, 0) + 1
+                    if count > 1:
+                        nested_q["key"] = f"{nested_key}_{count}"
     
     for q in questions:
         dedupe_question(q)
 
 def validate_form(questions: List[Question]) -> List[str]:
-    errs=[]
-    for q in questions:
-        if q.type not in ALLOWED_TYPES:
-            errs.append(f"Unsupported type for {q.key}: {q.type}")
-    sig = [q for q in questions if q.type=="signature"]
-    if len(sig)!=1 or sig[0].key!="signature":
+    # Project the attributes every check reads into parallel lists once
+    types = [q.type for q in questions]
+    keys = [q.key for q in questions]
+    errs = [f"Unsupported type for {k}: {t}" for k, t in zip(keys, types) if t not in ALLOWED_TYPES]
+    sig = [k for k, t in zip(keys, types) if t=="signature"]
+    if len(sig)!=1 or sig[0]!="signature":
         errs.append("Signature rule violated (need exactly one with key='signature').")
-    for q in questions:
-        if q.type in ("radio","dropdown","checkbox"):
+    for q, t, k in zip(questions, types, keys):
+        if t in ("radio","dropdown","checkbox"):
             for opt in q.control.get("options", []):
                 if opt.get("value") in (None,""):
-                    errs.append(f"Empty option value in {q.key}")
+                    errs.append(f"Empty option value in {k}")
         # Patch 2: Validate field key format for Modento compliance
-        if not is_valid_modento_key(q.key):
-            errs.append(f"Invalid key format: '{q.key}' (must be snake_case with only lowercase letters, digits, underscores)")
+        if not is_valid_modento_key(k):
+            errs.append(f"Invalid key format: '{k}' (must be snake_case with only lowercase letters, digits, underscores)")
     return errs
 
 
@@ -4228,13 +4452,10 @@ def is_valid_modento_key(key: str) -> bool:
         >>> is_valid_modento_key("")  # empty
         False
     """
-    if not key:
-        return False
-    
-    # Must match snake_case pattern: lowercase letters, digits, underscores
-    # Must not start with a digit
-    pattern = r'^[a-z_][a-z0-9_]*$'
-    return bool(re.match(pattern, key))
+    # Must be snake_case: lowercase letters, digits, underscores only, and must
+    # not start with a digit. A set check replaces re.match(r'^[a-z_][a-z0-9_]*$'),
+    # which also let a trailing newline through.
+    return bool(key) and not key[0].isdigit() and MODENTO_KEY_CHARS.issuperset(key)
 
 # ============================================================================
 # SECTION 5: POSTPROCESSING FUNCTIONS
@@ -4256,7 +4477,7 @@ def questions_to_json(questions: List[Question]) -> List[Dict]:
                 "optional": q.optional, "type": q.type, "control": q.control or {}}
         
         # Fix 2: Add conditional "if" property for follow-up fields
-        if hasattr(q, 'conditional_on') and q.conditional_on:
+        if q.conditional_on:
             # Convert conditional_on to "if" array format
             item["if"] = [{"key": cond_key, "value": cond_val} for cond_key, cond_val in q.conditional_on]
         
@@ -4268,7 +4489,8 @@ def questions_to_json(questions: List[Question]) -> List[Dict]:
 # ---------- Post-processing helpers
 
 def postprocess_merge_hear_about_us(payload: List[dict]) -> List[dict]:
-    idxs = [i for i,q in enumerate(payload) if HEAR_ABOUT_RE.search(q.get("title",""))]
+    search = HEAR_ABOUT_RE.search
+    idxs = [i for i,q in enumerate(payload) if search(q.get("title",""))]
     if len(idxs) <= 1:
         return payload
     keep = idxs[0]
@@ -4277,21 +4499,31 @@ def postprocess_merge_hear_about_us(payload: List[dict]) -> List[dict]:
     for i in idxs:
         q = payload[i]
         for o in (q.get("control",{}).get("options") or []):
-            k = normalize_opt_name(o.get("name",""))
+            name = o.get("name","")
+            k = normalize_opt_name(name)
             if not k: continue
-            all_opts[k] = {"name": o.get("name",""), "value": o.get("value", slugify(o.get("name",""),80))}
+            all_opts[k] = {"name": name, "value": o["value"] if "value" in o else slugify(name,80)}
         extra = q.get("control",{}).get("extra")
         if extra: extras.append(extra)
     payload[keep]["control"]["options"] = list(all_opts.values())
     payload[keep]["control"]["multi"] = True
     if extras:
         payload[keep]["control"]["extra"] = {"type":"Input","hint":"Other (please specify)"}
-    for i in sorted(idxs[1:], reverse=True):
-        payload.pop(i)
+    drop = set(idxs[1:])
+    payload[:] = [q for i, q in enumerate(payload) if i not in drop]
     return payload
 
 # ---------- Fix 3: Enhanced Malformed Conditions Detection
 
+# Condition words whose pile-up in one dropdown title marks a malformed field
+MALFORMED_CONDITION_KEYWORDS = (
+    'diabetes', 'cancer', 'heart', 'disease', 'arthritis', 'hepatitis',
+    'asthma', 'anxiety', 'depression', 'ulcer', 'thyroid', 'kidney',
+    'liver', 'tuberculosis', 'hiv', 'aids', 'stroke', 'bleeding',
+    'anemia', 'glaucoma', 'angina', 'valve', 'neurological'
+)
+CAPITALIZED_RUN_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
 def is_malformed_condition_field(field: dict) -> bool:
     """
     Detect if a field is a malformed medical/dental condition field.
@@ -4316,27 +4548,18 @@ def is_malformed_condition_field(field: dict) -> bool:
     title_lower = title.lower()
     
     # Check 1: Title has multiple medical condition keywords
-    condition_keywords = [
-        'diabetes', 'cancer', 'heart', 'disease', 'arthritis', 'hepatitis',
-        'asthma', 'anxiety', 'depression', 'ulcer', 'thyroid', 'kidney',
-        'liver', 'tuberculosis', 'hiv', 'aids', 'stroke', 'bleeding',
-        'anemia', 'glaucoma', 'angina', 'valve', 'neurological'
-    ]
-    
-    keyword_count = sum(1 for kw in condition_keywords if kw in title_lower)
+    keyword_count = sum(1 for kw in MALFORMED_CONDITION_KEYWORDS if kw in title_lower)
     
     # If title has 3+ condition keywords, likely malformed
     if keyword_count >= 3:
         return True
     
     # Check 2: Title is very long and has some condition keywords
-    word_count = len(title.split())
-    if word_count >= 8 and keyword_count >= 2:
+    if keyword_count >= 2 and len(title.split()) >= 8:
         return True
     
     # Check 3: Title contains multiple capitalized words that look like conditions
-    capitalized_words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', title)
-    if len(capitalized_words) >= 4 and keyword_count >= 1:
+    if keyword_count >= 1 and len(CAPITALIZED_RUN_RE.findall(title)) >= 4:
         return True
     
     return False
@@ -4351,22 +4574,20 @@ def _looks_like_medical_condition(opt_name: str) -> bool:
     return any(t in w for t in _COND_TOKENS)
 
 
+# Medical condition keywords for identifying individual condition fields
+CONDITION_KEYWORDS = MALFORMED_CONDITION_KEYWORDS + (
+    'alzheimer', 'blood pressure', 'cholesterol', 'pacemaker', 'chemotherapy',
+    'radiation', 'convulsion', 'seizure', 'epilepsy', 'migraine', 'allergy'
+)
+CONDITION_KEYWORD_RE = re.compile("|".join(map(re.escape, CONDITION_KEYWORDS)))
+
+
 def postprocess_consolidate_medical_conditions(payload: List[dict]) -> List[dict]:
     """
     Enhanced version that consolidates both well-formed and malformed condition dropdowns,
     plus individual checkbox/radio fields that look like medical conditions (Fix 1).
     """
     
-    # Medical condition keywords for identifying individual condition fields
-    CONDITION_KEYWORDS = [
-        'diabetes', 'cancer', 'heart', 'disease', 'arthritis', 'hepatitis',
-        'asthma', 'anxiety', 'depression', 'ulcer', 'thyroid', 'kidney',
-        'liver', 'tuberculosis', 'hiv', 'aids', 'stroke', 'bleeding',
-        'anemia', 'glaucoma', 'angina', 'valve', 'neurological', 'alzheimer',
-        'blood pressure', 'cholesterol', 'pacemaker', 'chemotherapy', 'radiation',
-        'convulsion', 'seizure', 'epilepsy', 'migraine', 'allergy'
-    ]
-    
     # Separate handling for malformed dropdowns, well-formed dropdowns, and individual checkboxes
     malformed_indices = []
     wellformed_groups_by_section: Dict[str, List[int]] = defaultdict(list)
@@ -4374,45 +4595,41 @@ def postprocess_consolidate_medical_conditions(payload: List[dict]) -> List[dict
     
     for i, q in enumerate(payload):
         section = q.get('section', 'General')
+        qtype = q.get('type')
         
         # Check if malformed
         if is_malformed_condition_field(q):
             malformed_indices.append(i)
             continue
         
+        is_multi_dropdown = qtype == 'dropdown' and q.get('control', {}).get('multi', False)
+        opts = (q.get('control', {}).get('options') or []) if is_multi_dropdown else []
+        
         # Check if well-formed medical condition field (original logic)
-        if (q.get('type') == 'dropdown' and 
-            q.get('control', {}).get('multi', False) and 
-            q.get('section') in {'Medical History', 'Dental History'}):
-            
-            opts = q.get('control', {}).get('options') or []
+        if is_multi_dropdown and section in {'Medical History', 'Dental History'}:
             if len(opts) >= 5 and sum(_looks_like_medical_condition(o.get('name', '')) for o in opts) >= 3:
                 wellformed_groups_by_section[section].append(i)
                 continue
         
         # Check if single-option multi-select dropdown (likely should be consolidated)
-        if (q.get('type') == 'dropdown' and 
-            q.get('control', {}).get('multi', False) and 
-            section in {'Medical History', 'General', 'Dental History', 'Patient Information'}):
-            
-            opts = q.get('control', {}).get('options') or []
+        if is_multi_dropdown and section in {'Medical History', 'General', 'Dental History', 'Patient Information'}:
             if len(opts) == 1:
                 # Single option dropdown - treat like individual condition
                 title = opts[0].get('name', '').lower()
-                has_condition_keyword = any(kw in title for kw in CONDITION_KEYWORDS)
+                has_condition_keyword = CONDITION_KEYWORD_RE.search(title) is not None
                 # Also check the field title
                 field_title = q.get('title', '').lower()
-                has_condition_in_title = any(kw in field_title for kw in CONDITION_KEYWORDS)
+                has_condition_in_title = CONDITION_KEYWORD_RE.search(field_title) is not None
                 
                 if has_condition_keyword or has_condition_in_title:
                     individual_condition_indices[section].append(i)
                     continue
         
         # Check if individual checkbox/radio/input that looks like a medical condition (Fix 1)
-        if q.get('type') in ['checkbox', 'radio', 'input'] and section in {'Medical History', 'General', 'Dental History'}:
+        if qtype in ['checkbox', 'radio', 'input'] and section in {'Medical History', 'General', 'Dental History'}:
             title = q.get('title', '').lower()
             # Check if title contains medical condition keywords
-            has_condition_keyword = any(kw in title for kw in CONDITION_KEYWORDS)
+            has_condition_keyword = CONDITION_KEYWORD_RE.search(title) is not None
             # Or if it's a short title (1-4 words) in Medical History/Dental History section
             is_short_medical = section in {'Medical History', 'Dental History'} and len(title.split()) <= 4
             
@@ -4422,7 +4639,7 @@ def postprocess_consolidate_medical_conditions(payload: List[dict]) -> List[dict
     # Consolidate malformed fields
     if malformed_indices:
         # Extract all options from malformed fields
-        all_options = []
+        consolidated: Dict[str, dict] = {}
         sections = set()
         
         for idx in malformed_indices:
@@ -4438,20 +4655,19 @@ def postprocess_consolidate_medical_conditions(payload: List[dict]) -> List[dict
                 # Clean up option name
                 opt_name = opt_name.strip()
                 
-                # Skip if too short or looks like junk
-                if len(opt_name) < 3:
+                # Skip if too short or looks like junk, or already collected
+                if len(opt_name) < 3 or opt_name in consolidated:
                     continue
                 
-                # Add to consolidated list if not duplicate
-                if opt_name not in [o['name'] for o in all_options]:
-                    all_options.append({
-                        'name': opt_name,
-                        'value': opt_value if opt_value else slugify(opt_name, 80)
-                    })
+                consolidated[opt_name] = {
+                    'name': opt_name,
+                    'value': opt_value if opt_value else slugify(opt_name, 80)
+                }
+        all_options = list(consolidated.values())
         
         # Create consolidated field
         if all_options:
-            consolidated_section = list(sections)[0] if len(sections) == 1 else 'Medical History'
+            consolidated_section = next(iter(sections)) if len(sections) == 1 else 'Medical History'
             
             consolidated_field = {
                 'key': 'medical_conditions_consolidated',
@@ -4460,7 +4676,7 @@ def postprocess_consolidate_medical_conditions(payload: List[dict]) -> List[dict
                 'section': consolidated_section,
                 'optional': False,
                 'control': {
-                    'options': sorted(all_options, key=lambda x: x['name']),
+                    'options': sorted(all_options, key=itemgetter('name')),
                     'multi': True
                 }
             }
@@ -4478,22 +4694,20 @@ def postprocess_consolidate_medical_conditions(payload: List[dict]) -> List[dict
             continue
         
         keep = groups[0]
-        seen: Set[str] = set()
-        merged: List[dict] = []
+        merged: Dict[str, dict] = {}
         
         for i in groups:
             for o in (payload[i].get('control', {}).get('options') or []):
                 name = SPELL_FIX.get(o.get('name', ''), o.get('name', ''))
                 norm = normalize_opt_name(name)
-                if not norm or norm in seen:
+                if not norm or norm in merged:
                     continue
-                seen.add(norm)
-                merged.append({'name': name, 'value': o.get('value', slugify(name, 80))})
+                merged[norm] = {'name': name, 'value': o['value'] if 'value' in o else slugify(name, 80)}
         
         if section == 'Medical History':
             payload[keep]['title'] = 'Medical Conditions'
             payload[keep]['key'] = 'medical_conditions'
-        payload[keep]['control']['options'] = merged
+        payload[keep]['control']['options'] = list(merged.values())
         
         for i in sorted(groups[1:], reverse=True):
             payload.pop(i)
@@ -4548,7 +4762,7 @@ def postprocess_consolidate_medical_conditions(payload: List[dict]) -> List[dict
                 'section': section,
                 'optional': False,
                 'control': {
-                    'options': sorted(consolidated_options, key=lambda x: x['name']),
+                    'options': sorted(consolidated_options, key=itemgetter('name')),
                     'multi': True
                 }
             }
@@ -4565,30 +4779,83 @@ def postprocess_signature_uniqueness(payload: List[dict]) -> List[dict]:
     if not sig_idx:
         payload.append({"key":"signature","title":"Signature","section":"Signature","type":"signature","control":{}})
     elif len(sig_idx) > 1:
-        for i in sorted(sig_idx[1:], reverse=True):
-            payload.pop(i)
+        drop = set(sig_idx[1:])
+        payload[:] = [q for i, q in enumerate(payload) if i not in drop]
         payload[sig_idx[0]].update({"key":"signature","title":"Signature","section":"Signature","type":"signature"})
     else:
         i = sig_idx[0]
         payload[i].update({"key":"signature","title":"Signature","section":"Signature","type":"signature"})
     return payload
 
+# Key fragments that pull a field into Insurance, and key prefixes that pull it into Patient Information
+REHOME_INSURANCE_KEY_RE = re.compile("|".join(map(re.escape, (
+    "insurance_", "insured", "policy", "group", "member id", "id number"))))
+REHOME_DEMOGRAPHIC_KEY_PREFIXES = ("last_name","first_name","mi","date_of_birth","address","city","state","zipcode","email","phone",
+                                   "mobile_phone","home_phone","work_phone","drivers_license","employer","occupation","parent_")
+
 def postprocess_rehome_by_key(payload: List[dict], dbg: Optional[DebugLogger]=None) -> List[dict]:
-    ins_keys = ("insurance_", "insured", "policy", "group", "member id", "id number")
-    demo_keys = ("last_name","first_name","mi","date_of_birth","address","city","state","zipcode","email","phone",
-                 "mobile_phone","home_phone","work_phone","drivers_license","employer","occupation","parent_")
     for q in payload:
         t = norm_title(q.get("title",""))
         k = q.get("key","")
         sec = q.get("section","General")
-        if (sec not in {"Insurance"} and (t.count("insurance") or any(s in k for s in ins_keys))):
+        if (sec not in {"Insurance"} and ("insurance" in t or REHOME_INSURANCE_KEY_RE.search(k))):
             q["section"] = "Insurance"
             if dbg: dbg.gate(f"rehome -> Insurance :: {q.get('title','')}")
-        if (sec not in {"Patient Information","Insurance"} and (any(k.startswith(d) for d in demo_keys) or "parent" in k)):
+        if (sec not in {"Patient Information","Insurance"} and (k.startswith(REHOME_DEMOGRAPHIC_KEY_PREFIXES) or "parent" in k)):
             q["section"] = "Patient Information"
             if dbg: dbg.gate(f"rehome -> Patient Information :: {q.get('title','')}")
     return payload
 
+# Strong keywords that alone indicate medical history
+STRONG_MEDICAL_KEYWORDS = (
+    'physician', 'hospitalized', 'surgery', 'surgical', 'operation',
+    'medication', 'medicine', 'prescription', 
+    'allergy', 'allergic',
+    # Common disease/condition patterns
+    'hiv', 'aids', 'diabetes', 'cancer', 'heart', 'blood pressure',
+    'hepatitis', 'asthma', 'arthritis', 'alzheimer', 'anemia'
+)
+STRONG_MEDICAL_KEYWORD_RE = re.compile("|".join(map(re.escape, STRONG_MEDICAL_KEYWORDS)))
+
+MEDICAL_KEYWORDS = (
+    'doctor', 'hospital', 
+    'drug', 'pills',
+    'illness', 'disease', 'condition', 'diagnosis',
+    'reaction', 'symptom', 'discomfort', 'health',
+    'care now', 'taking any', 'have you had', 'have you ever'
+)
+
+DENTAL_KEYWORDS = (
+    'tooth', 'teeth', 'gum', 'gums',
+    'dental', 'dentist', 'orthodontic', 'orthodontist',
+    'cleaning', 'cavity', 'cavities', 'crown', 'filling',
+    'bite', 'jaw', 'tmj', 'smile'
+)
+
+# Parity Improvement #12: Additional section keywords
+PATIENT_INFO_KEYWORDS = (
+    'name', 'address', 'phone', 'email', 'birth', 'dob',
+    'ssn', 'social security', 'gender', 'marital', 'employer',
+    'occupation', 'contact', 'nickname', 'preferred name'
+)
+
+INSURANCE_KEYWORDS = (
+    'insurance', 'policy', 'coverage', 'carrier', 'subscriber',
+    'member id', 'group number', 'plan', 'benefits', 'primary insurance',
+    'secondary insurance', 'insurance company'
+)
+
+EMERGENCY_KEYWORDS = (
+    'emergency contact', 'emergency', 'notify', 'relationship',
+    'emergency phone', 'in case of emergency'
+)
+
+CONSENT_KEYWORDS = (
+    'consent', 'acknowledge', 'agree', 'understand', 'authorize',
+    'risks', 'complications', 'terms', 'conditions', 'authorization'
+)
+
+
 def postprocess_infer_sections(payload: List[dict], dbg: Optional[DebugLogger] = None) -> List[dict]:
     """
     Reassign fields from 'General' to more specific sections based on content.
@@ -4596,107 +4863,62 @@ def postprocess_infer_sections(payload: List[dict], dbg: Optional[DebugLogger] =
     
     Parity Improvement #12: Enhanced section detection with expanded keywords.
     """
-    # Strong keywords that alone indicate medical history
-    STRONG_MEDICAL_KEYWORDS = [
-        'physician', 'hospitalized', 'surgery', 'surgical', 'operation',
-        'medication', 'medicine', 'prescription', 
-        'allergy', 'allergic',
-        # Common disease/condition patterns
-        'hiv', 'aids', 'diabetes', 'cancer', 'heart', 'blood pressure',
-        'hepatitis', 'asthma', 'arthritis', 'alzheimer', 'anemia'
-    ]
-    
-    MEDICAL_KEYWORDS = [
-        'doctor', 'hospital', 
-        'drug', 'pills',
-        'illness', 'disease', 'condition', 'diagnosis',
-        'reaction', 'symptom', 'discomfort', 'health',
-        'care now', 'taking any', 'have you had', 'have you ever'
-    ]
-    
-    DENTAL_KEYWORDS = [
-        'tooth', 'teeth', 'gum', 'gums',
-        'dental', 'dentist', 'orthodontic', 'orthodontist',
-        'cleaning', 'cavity', 'cavities', 'crown', 'filling',
-        'bite', 'jaw', 'tmj', 'smile'
-    ]
-    
-    # Parity Improvement #12: Additional section keywords
-    PATIENT_INFO_KEYWORDS = [
-        'name', 'address', 'phone', 'email', 'birth', 'dob',
-        'ssn', 'social security', 'gender', 'marital', 'employer',
-        'occupation', 'contact', 'nickname', 'preferred name'
-    ]
-    
-    INSURANCE_KEYWORDS = [
-        'insurance', 'policy', 'coverage', 'carrier', 'subscriber',
-        'member id', 'group number', 'plan', 'benefits', 'primary insurance',
-        'secondary insurance', 'insurance company'
-    ]
-    
-    EMERGENCY_KEYWORDS = [
-        'emergency contact', 'emergency', 'notify', 'relationship',
-        'emergency phone', 'in case of emergency'
-    ]
-    
-    CONSENT_KEYWORDS = [
-        'consent', 'acknowledge', 'agree', 'understand', 'authorize',
-        'risks', 'complications', 'terms', 'conditions', 'authorization'
-    ]
-    
     for item in payload:
-        if item.get('section') == 'General':
-            title_lower = item.get('title', '').lower()
-            key_lower = item.get('key', '').lower()
-            combined = title_lower + ' ' + key_lower
-            
-            # Check for strong medical keywords (single match is enough)
-            has_strong_medical = any(kw in combined for kw in STRONG_MEDICAL_KEYWORDS)
-            
-            # Count keyword matches for all categories
-            medical_score = sum(1 for kw in MEDICAL_KEYWORDS if kw in combined)
-            dental_score = sum(1 for kw in DENTAL_KEYWORDS if kw in combined)
-            patient_score = sum(1 for kw in PATIENT_INFO_KEYWORDS if kw in combined)
-            insurance_score = sum(1 for kw in INSURANCE_KEYWORDS if kw in combined)
-            emergency_score = sum(1 for kw in EMERGENCY_KEYWORDS if kw in combined)
-            consent_score = sum(1 for kw in CONSENT_KEYWORDS if kw in combined)
-            
-            # Reassign based on signals (in order of priority)
-            # Patient Information
-            if patient_score >= 2:
-                if dbg:
-                    dbg.gate(f"section_inference -> Patient Information :: {item.get('title', '')} (score={patient_score})")
-                item['section'] = 'Patient Information'
-            # Insurance
-            elif insurance_score >= 1:
-                if dbg:
-                    dbg.gate(f"section_inference -> Insurance :: {item.get('title', '')} (score={insurance_score})")
-                item['section'] = 'Insurance'
-            # Emergency Contact
-            elif emergency_score >= 1:
-                if dbg:
-                    dbg.gate(f"section_inference -> Emergency Contact :: {item.get('title', '')} (score={emergency_score})")
-                item['section'] = 'Emergency Contact'
-            # Consent/Terms
-            elif consent_score >= 2 or (consent_score >= 1 and len(title_lower) > 100):
-                if dbg:
-                    dbg.gate(f"section_inference -> Consent :: {item.get('title', '')} (score={consent_score})")
-                item['section'] = 'Consent'
-            # Medical History (strong keyword alone is enough)
-            elif has_strong_medical and dental_score == 0:
-                if dbg:
-                    dbg.gate(f"section_inference -> Medical History :: {item.get('title', '')} (strong keyword match)")
-                item['section'] = 'Medical History'
-            # Or 2+ regular medical keywords
-            elif medical_score >= 2 and medical_score > dental_score:
-                if dbg:
-                    dbg.gate(f"section_inference -> Medical History :: {item.get('title', '')} (score={medical_score})")
-                item['section'] = 'Medical History'
-            # Dental History
-            elif dental_score >= 2 and dental_score > medical_score:
-                if dbg:
-                    dbg.gate(f"section_inference -> Dental History :: {item.get('title', '')} (score={dental_score})")
-                item['section'] = 'Dental History'
+        if item.get('section') != 'General':
+            continue
+        
+        title = item.get('title', '')
+        title_lower = title.lower()
+        key_lower = item.get('key', '').lower()
+        combined = title_lower + ' ' + key_lower
+        
+        # Check for strong medical keywords (single match is enough)
+        has_strong_medical = STRONG_MEDICAL_KEYWORD_RE.search(combined) is not None
+        
+        # Count keyword matches for all categories
+        medical_score = sum(1 for kw in MEDICAL_KEYWORDS if kw in combined)
+        dental_score = sum(1 for kw in DENTAL_KEYWORDS if kw in combined)
+        patient_score = sum(1 for kw in PATIENT_INFO_KEYWORDS if kw in combined)
+        insurance_score = sum(1 for kw in INSURANCE_KEYWORDS if kw in combined)
+        emergency_score = sum(1 for kw in EMERGENCY_KEYWORDS if kw in combined)
+        consent_score = sum(1 for kw in CONSENT_KEYWORDS if kw in combined)
+        
+        # Reassign based on signals (in order of priority)
+        # Patient Information
+        if patient_score >= 2:
+            if dbg:
+                dbg.gate(f"section_inference -> Patient Information :: {title} (score={patient_score})")
+            item['section'] = 'Patient Information'
+        # Insurance
+        elif insurance_score >= 1:
+            if dbg:
+                dbg.gate(f"section_inference -> Insurance :: {title} (score={insurance_score})")
+            item['section'] = 'Insurance'
+        # Emergency Contact
+        elif emergency_score >= 1:
+            if dbg:
+                dbg.gate(f"section_inference -> Emergency Contact :: {title} (score={emergency_score})")
+            item['section'] = 'Emergency Contact'
+        # Consent/Terms
+        elif consent_score >= 2 or (consent_score >= 1 and len(title_lower) > 100):
+            if dbg:
+                dbg.gate(f"section_inference -> Consent :: {title} (score={consent_score})")
+            item['section'] = 'Consent'
+        # Medical History (strong keyword alone is enough)
+        elif has_strong_medical and dental_score == 0:
+            if dbg:
+                dbg.gate(f"section_inference -> Medical History :: {title} (strong keyword match)")
+            item['section'] = 'Medical History'
+        # Or 2+ regular medical keywords
+        elif medical_score >= 2 and medical_score > dental_score:
+            if dbg:
+                dbg.gate(f"section_inference -> Medical History :: {title} (score={medical_score})")
+            item['section'] = 'Medical History'
+        # Dental History
+        elif dental_score >= 2 and dental_score > medical_score:
+            if dbg:
+                dbg.gate(f"section_inference -> Dental History :: {title} (score={dental_score})")
+            item['section'] = 'Dental History'
     
     return payload
 
@@ -4760,6 +4982,10 @@ def postprocess_filter_document_titles(payload: List[dict], dbg: Optional[DebugL
     return filtered
 
 
+KEY_NUMBER_SUFFIX_RE = re.compile(r'_(\d+)$')
+KEY_SCOPE_SUFFIX_RE = re.compile(r'__\w+$')
+KEY_SUFFIX_RE = re.compile(r'(_\d+|__\w+)$')
+
 def postprocess_consolidate_duplicates(payload: List[dict], dbg: Optional[DebugLogger] = None) -> List[dict]:
     """
     Remove duplicate fields, keeping the one in the most appropriate section.
@@ -4782,13 +5008,13 @@ def postprocess_consolidate_duplicates(payload: List[dict], dbg: Optional[DebugL
     
     # Track seen keys and their indices
     seen_keys = {}
-    to_remove = []
+    to_remove: Set[int] = set()
     
     for i, item in enumerate(payload):
         key = item.get('key', '')
         # Normalize key by removing numeric suffixes and scope markers
-        key_base = re.sub(r'_\d+$', '', key)  # Remove _2, _3, etc.
-        key_base = re.sub(r'__\w+$', '', key_base)  # Remove __primary, __secondary, etc.
+        key_base = KEY_NUMBER_SUFFIX_RE.sub('', key)  # Remove _2, _3, etc.
+        key_base = KEY_SCOPE_SUFFIX_RE.sub('', key_base)  # Remove __primary, __secondary, etc.
         
         # Check if this is a common field that might be duplicated
         if key_base in COMMON_FIELDS:
@@ -4801,30 +5027,42 @@ def postprocess_consolidate_duplicates(payload: List[dict], dbg: Optional[DebugL
                 
                 if curr_section == preferred_section and prev_section != preferred_section:
                     # Current is in preferred section, remove previous
-                    to_remove.append(prev_idx)
+                    to_remove.add(prev_idx)
                     seen_keys[key_base] = i
                     if dbg:
                         dbg.gate(f"duplicate_consolidation -> Removed {key_base} from {prev_section}, kept in {curr_section}")
                 elif prev_section == preferred_section and curr_section != preferred_section:
                     # Previous is in preferred section, remove current
-                    to_remove.append(i)
+                    to_remove.add(i)
                     if dbg:
                         dbg.gate(f"duplicate_consolidation -> Removed {key} from {curr_section}, kept {key_base} in {prev_section}")
                 else:
                     # Neither in preferred or both in preferred, keep first occurrence
-                    to_remove.append(i)
+                    to_remove.add(i)
                     if dbg:
                         dbg.gate(f"duplicate_consolidation -> Removed duplicate {key} from {curr_section}")
             else:
                 seen_keys[key_base] = i
     
-    # Remove duplicates in reverse order to maintain indices
-    for idx in sorted(set(to_remove), reverse=True):
-        payload.pop(idx)
+    # Remove duplicates in one rebuild
+    if to_remove:
+        payload[:] = [item for i, item in enumerate(payload) if i not in to_remove]
     
     return payload
 
 
+# Medical/dental terms that pile up in a run-together grid title
+GRID_CONDITION_KEYWORDS = (
+    'therapy', 'disease', 'disorder', 'condition', 'illness', 'syndrome',
+    'pain', 'fever', 'bleeding', 'valve', 'joint', 'respiratory',
+    'cardiovascular', 'hematologic', 'psychiatric', 'gastrointestinal',
+    'arthritis', 'diabetes', 'asthma', 'seizure', 'allergy', 'nursing',
+    'teeth', 'grinding', 'clenching', 'sucking', 'biting', 'chewing',
+    'discolored', 'worn', 'crooked', 'spaces', 'overbite', 'sensitivity',
+    'anesthesia', 'sulfa', 'drugs'
+)
+GRID_INSTRUCTION_RE = re.compile(r'\b(please|mark|any|conditions|apply|do you|have you)\b')
+
 def postprocess_consolidate_malformed_grids(payload: List[dict], dbg: Optional[DebugLogger] = None) -> List[dict]:
     """
     Archivev10 Fix 4: Consolidate malformed multi-column checkbox fields.
@@ -4848,34 +5086,17 @@ def postprocess_consolidate_malformed_grids(payload: List[dict], dbg: Optional[D
         if item_type != 'dropdown':
             continue
         
-        # Check if title looks malformed (3+ medical/dental terms concatenated)
-        # Split title into words and count capitalized medical terms
-        words = title.split()
-        capitalized_words = [w for w in words if w and w[0].isupper() and len(w) > 2]
-        
-        # Check for medical/dental keywords
-        medical_keywords = [
-            'therapy', 'disease', 'disorder', 'condition', 'illness', 'syndrome',
-            'pain', 'fever', 'bleeding', 'valve', 'joint', 'respiratory',
-            'cardiovascular', 'hematologic', 'psychiatric', 'gastrointestinal',
-            'arthritis', 'diabetes', 'asthma', 'seizure', 'allergy', 'nursing',
-            'teeth', 'grinding', 'clenching', 'sucking', 'biting', 'chewing',
-            'discolored', 'worn', 'crooked', 'spaces', 'overbite', 'sensitivity',
-            'anesthesia', 'sulfa', 'drugs'
-        ]
-        
-        title_lower = title.lower()
-        keyword_count = sum(1 for kw in medical_keywords if kw in title_lower)
-        
         # Enhanced detection: Malformed if title lacks connecting words
         # Good titles have "please mark", "do you", "have you", etc.
-        has_instruction = bool(re.search(r'\b(please|mark|any|conditions|apply|do you|have you)\b', title_lower))
+        title_lower = title.lower()
+        if GRID_INSTRUCTION_RE.search(title_lower):
+            continue
         
-        # Malformed if: (4+ capitalized words AND no instructions) OR (4+ keywords AND no instructions)
-        is_malformed = False
-        if not has_instruction:
-            if len(capitalized_words) >= 4 or keyword_count >= 4:
-                is_malformed = True
+        # Check if title looks malformed (3+ medical/dental terms concatenated):
+        # 4+ capitalized words or 4+ medical/dental keywords
+        cap_count = sum(1 for w in title.split() if len(w) > 2 and w[0].isupper())
+        is_malformed = (cap_count >= 4
+                        or sum(1 for kw in GRID_CONDITION_KEYWORDS if kw in title_lower) >= 4)
         
         if is_malformed:
             # Also check that options exist and are reasonable
@@ -4890,16 +5111,13 @@ def postprocess_consolidate_malformed_grids(payload: List[dict], dbg: Optional[D
         return payload
     
     # Group malformed fields by section
-    by_section = {}
+    by_section: Dict[str, List[int]] = defaultdict(list)
     for idx in malformed_indices:
-        section = payload[idx].get('section', 'General')
-        if section not in by_section:
-            by_section[section] = []
-        by_section[section].append(idx)
+        by_section[payload[idx].get('section', 'General')].append(idx)
     
     # Consolidate each section's malformed fields
-    to_remove = []
-    new_fields = []
+    to_remove: Set[int] = set()
+    new_fields: Dict[int, dict] = {}
     
     for section, indices in by_section.items():
         # Skip if only 1 field (not worth consolidating)
@@ -4911,16 +5129,15 @@ def postprocess_consolidate_malformed_grids(payload: List[dict], dbg: Optional[D
         for idx in indices:
             options = payload[idx].get('control', {}).get('options', [])
             all_options.extend(options)
-            to_remove.append(idx)
+            to_remove.add(idx)
         
-        # Remove duplicates
-        seen = set()
-        unique_options = []
+        # Remove duplicates, keeping the first option per lowercased name
+        unique_by_name = {}
         for opt in all_options:
             opt_name = opt.get('name', '') if isinstance(opt, dict) else opt
-            if opt_name and opt_name.lower() not in seen:
-                seen.add(opt_name.lower())
-                unique_options.append(opt)
+            if opt_name:
+                unique_by_name.setdefault(opt_name.lower(), opt)
+        unique_options = list(unique_by_name.values())
         
         # Create consolidated field
         if len(unique_options) >= 5:
@@ -4946,27 +5163,27 @@ def postprocess_consolidate_malformed_grids(payload: List[dict], dbg: Optional[D
                 }
             }
             
-            new_fields.append((indices[0], new_field))  # Insert at position of first malformed field
+            new_fields[indices[0]] = new_field  # Insert at position of first malformed field
             
             if dbg:
                 dbg.gate(f"malformed_grid_consolidated -> {len(indices)} fields into '{title}' with {len(unique_options)} options")
     
-    # Remove malformed fields in reverse order
-    for idx in sorted(set(to_remove), reverse=True):
-        payload.pop(idx)
-    
-    # Insert consolidated fields
-    for insert_pos, new_field in sorted(new_fields, reverse=True):
-        # Adjust insert position if we've already removed items
-        adjusted_pos = insert_pos
-        for removed_idx in sorted(to_remove):
-            if removed_idx < insert_pos:
-                adjusted_pos -= 1
-        payload.insert(adjusted_pos, new_field)
+    # Rebuild once: drop malformed fields, putting each consolidated field
+    # where its section's first malformed field was
+    rebuilt = []
+    for i, item in enumerate(payload):
+        if i in new_fields:
+            rebuilt.append(new_fields[i])
+        if i not in to_remove:
+            rebuilt.append(item)
+    payload[:] = rebuilt
     
     return payload
 
 
+# Phrases (matched on the lowercased title) that mark a question asking to pick items
+SELECTION_QUESTION_RE = re.compile(r'allergic|any of the following|select|choose|check|mark')
+
 def postprocess_consolidate_continuation_options(payload: List[dict], dbg: Optional[DebugLogger] = None) -> List[dict]:
     """
     Archivev18 Fix 4: Consolidate checkbox fields that are continuations of previous fields.
@@ -4986,26 +5203,22 @@ def postprocess_consolidate_continuation_options(payload: List[dict], dbg: Optio
         title = item.get('title', '')
         
         # Check if this field looks like concatenated options (3+ capitalized words, no question marks/colons)
-        # and is a dropdown with multiple options
-        words = title.split()
-        capitalized = [w for w in words if w and w[0].isupper()]
-        
+        # and is a dropdown with multiple options; cheapest checks first
         is_concatenated = (
-            len(capitalized) >= 3 and 
+            i > 0 and
+            item.get('type') in ('dropdown', 'radio') and
             '?' not in title and 
             not title.endswith(':') and
-            item.get('type') in ('dropdown', 'radio')
+            sum(1 for w in title.split() if w[0].isupper()) >= 3
         )
         
-        if is_concatenated and i > 0:
+        if is_concatenated:
             prev_item = payload[i - 1]
             prev_title = prev_item.get('title', '').lower()
             
             # Check if previous field is in same section and is a question about selecting/checking items
             same_section = item.get('section') == prev_item.get('section')
-            is_selection_question = any(phrase in prev_title for phrase in [
-                'allergic', 'any of the following', 'select', 'choose', 'check', 'mark'
-            ])
+            is_selection_question = SELECTION_QUESTION_RE.search(prev_title) is not None
             prev_is_dropdown = prev_item.get('type') in ('dropdown', 'radio')
             
             if same_section and is_selection_question and prev_is_dropdown:
@@ -5044,6 +5257,13 @@ def postprocess_consolidate_continuation_options(payload: List[dict], dbg: Optio
     return payload
 
 
+# Column-overflow labels that get glued onto the end of field titles, e.g.
+# "Alcohol Frequency", "How much", "How long", "Comment:", "Pattern", "Conditions".
+# Only one label can end a title, so a single end-anchored alternation finds it.
+# ("Additional Comments" only ever lost its trailing "Comments", so it needs no branch.)
+OVERFLOW_LABEL_RE = re.compile(
+    r'\s+(?:Frequency|How\s+much|How\s+long|Comments?\s*:?|Pattern|Conditions?)\s*$', re.I)
+
 def postprocess_clean_overflow_titles(payload: List[dict], dbg: Optional[DebugLogger] = None) -> List[dict]:
     """
     Archivev11 Fix 3: Clean up field titles that have column overflow artifacts.
@@ -5051,35 +5271,28 @@ def postprocess_clean_overflow_titles(payload: List[dict], dbg: Optional[DebugLo
     Removes known label patterns that appear at the end of titles due to
     text extraction extending into adjacent columns.
     """
-    LABEL_PATTERNS = [
-        r'\s+Frequency\s*$',           # "Alcohol Frequency", "Drugs Frequency"
-        r'\s+How\s+much\s*$',          # "How much"
-        r'\s+How\s+long\s*$',          # "How long"
-        r'\s+Comments?\s*:?\s*$',      # "Comments", "Comment:"
-        r'\s+Additional\s+Comments?\s*:?\s*$',  # "Additional Comments"
-        r'\s+Pattern\s*$',             # "Pattern"
-        r'\s+Conditions?\s*$',         # "Conditions"
-    ]
-    
     for item in payload:
         title = item.get('title', '')
         original_title = title
         
-        # Check if title ends with a known label pattern
-        for pattern in LABEL_PATTERNS:
-            if re.search(pattern, title, re.I):
-                # Truncate at the pattern
-                title = re.sub(pattern, '', title, flags=re.I).strip()
-                
-                if dbg and title != original_title:
-                    dbg.gate(f"overflow_title_cleaned -> '{original_title}' → '{title}'")
-                
-                item['title'] = title
-                break
+        # Truncate a known label pattern at the end of the title
+        title, n = OVERFLOW_LABEL_RE.subn('', title)
+        if n:
+            title = title.strip()
+            
+            if dbg and title != original_title:
+                dbg.gate(f"overflow_title_cleaned -> '{original_title}' → '{title}'")
+            
+            item['title'] = title
     
     return payload
 
 
+# Phrases (matched on lowercased titles) for generic explanation fields and the
+# yes/no questions they follow
+GENERIC_EXPLAIN_TITLE_RE = re.compile(r'please explain|explanation|details|comments')
+YES_NO_QUESTION_CUE_RE = re.compile(r'yes or no|y or n|have you|are you|do you')
+
 def postprocess_make_explain_fields_unique(payload: List[dict], dbg: Optional[DebugLogger] = None) -> List[dict]:
     """
     Archivev11 Fix 5: Make duplicate titles unique by adding context.
@@ -5101,8 +5314,7 @@ def postprocess_make_explain_fields_unique(payload: List[dict], dbg: Optional[De
         section_title = f"{section}:{title}"
         
         # Archivev18 Fix 3: Handle generic explanation titles even on first occurrence
-        generic_titles = ['please explain', 'explanation', 'details', 'comments', 'if yes, please explain']
-        is_generic = any(gt in title.lower() for gt in generic_titles)
+        is_generic = GENERIC_EXPLAIN_TITLE_RE.search(title.lower()) is not None
         
         # If this is a generic title following a yes/no question, improve it immediately
         if is_generic and i > 0:
@@ -5110,7 +5322,7 @@ def postprocess_make_explain_fields_unique(payload: List[dict], dbg: Optional[De
             prev_title = prev_item.get('title', '')
             
             # If previous field is a yes/no question, use it as context
-            if any(yn in prev_title.lower() for yn in ['yes or no', 'y or n', 'have you', 'are you', 'do you']):
+            if YES_NO_QUESTION_CUE_RE.search(prev_title.lower()):
                 # Use full parent question title, but truncate if too long
                 # Remove trailing question mark and colon for better readability
                 context = prev_title.rstrip('?:').strip()
@@ -5139,15 +5351,15 @@ def postprocess_make_explain_fields_unique(payload: List[dict], dbg: Optional[De
             
             # Strategy 2: For repeated fields (like Insurance fields), add numeric suffix
             # Check if key has a numeric suffix or scope marker
-            key_has_suffix = bool(re.search(r'(_\d+|__\w+)$', key))
+            key_has_suffix = bool(KEY_SUFFIX_RE.search(key))
             if key_has_suffix:
                 # Extract suffix info
                 if '__primary' in key:
                     new_title = f"{title} (Primary)"
                 elif '__secondary' in key:
                     new_title = f"{title} (Secondary)"
-                elif re.search(r'_(\d+)$', key):
-                    match = re.search(r'_(\d+)$', key)
+                elif KEY_NUMBER_SUFFIX_RE.search(key):
+                    match = KEY_NUMBER_SUFFIX_RE.search(key)
                     num = match.group(1)
                     new_title = f"{title} #{num}"
                 else:
@@ -5193,15 +5405,14 @@ def postprocess_order_sections(payload: List[dict], dbg: Optional[DebugLogger] =
         "General": 8,
     }
     
-    def get_section_priority(field: dict) -> tuple:
+    def get_section_priority(field: dict) -> int:
         """
         Get sorting priority for a field.
-        Returns tuple of (section_order, original_index) for stable sorting.
+        sorted() is stable, so fields keep their original order within a section.
         """
         section = field.get("section", "General")
         # Get the priority from SECTION_ORDER, default to 99 for unknown sections
-        priority = SECTION_ORDER.get(section, 99)
-        return (priority, payload.index(field))
+        return SECTION_ORDER.get(section, 99)
     
     # Sort the payload by section order
     sorted_payload = sorted(payload, key=get_section_priority)
@@ -5219,6 +5430,18 @@ def postprocess_order_sections(payload: List[dict], dbg: Optional[DebugLogger] =
     
     return sorted_payload
 
+# Patterns for footer/header/witness fields that should be filtered out
+COMPLIANCE_EXCLUDED_PATTERNS = [re.compile(p, re.I) for p in (
+    r'\bpractice\s+(name|phone|address|email)\b',
+    r'\bwitness\b',
+    r'\boffice\s+(phone|address|email|name)\b',
+    r'\bfooter\b',
+    r'\bheader\b',
+    r'\bdoctor\s+(name|phone)\b',
+    r'\bclinic\s+(name|phone|address)\b',
+    r'\bfacility\s+(name|phone|address)\b',
+)]
+
 def postprocess_validate_modento_compliance(payload: List[dict], dbg: Optional[DebugLogger] = None) -> List[dict]:
     """
     Final validation to ensure Modento schema compliance.
@@ -5233,18 +5456,6 @@ def postprocess_validate_modento_compliance(payload: List[dict], dbg: Optional[D
     seen_keys = set()
     signature_count = 0
     
-    # Patterns for footer/header/witness fields that should be filtered out
-    EXCLUDED_PATTERNS = [
-        r'\bpractice\s+(name|phone|address|email)\b',
-        r'\bwitness\b',
-        r'\boffice\s+(phone|address|email|name)\b',
-        r'\bfooter\b',
-        r'\bheader\b',
-        r'\bdoctor\s+(name|phone)\b',
-        r'\bclinic\s+(name|phone|address)\b',
-        r'\bfacility\s+(name|phone|address)\b',
-    ]
-    
     # First pass: filter out excluded fields and collect issues
     filtered_payload = []
     for idx, field in enumerate(payload):
@@ -5254,8 +5465,8 @@ def postprocess_validate_modento_compliance(payload: List[dict], dbg: Optional[D
         
         # Check 3: Excluded fields (footer/header/witness) - FILTER THEM OUT
         is_excluded = False
-        for pattern in EXCLUDED_PATTERNS:
-            if re.search(pattern, title, re.I):
+        for pattern in COMPLIANCE_EXCLUDED_PATTERNS:
+            if pattern.search(title):
                 issues.append(f"Filtered out excluded field: {title}")
                 is_excluded = True
                 break
@@ -5365,6 +5576,9 @@ class Stats:
 # ============================================================================
 # Functions for matching fields to templates and writing output files.
 
+# Generic follow-up titles that must keep their own keys
+CONDITIONAL_FIELD_TITLES = frozenset({"please explain", "explanation", "details", "comments"})
+
 def apply_templates_and_count(payload: List[dict], catalog: Optional[TemplateCatalog], dbg: DebugLogger) -> Tuple[List[dict], int]:
     """
     Apply template matching and count matches.
@@ -5382,20 +5596,21 @@ def apply_templates_and_count(payload: List[dict], catalog: Optional[TemplateCat
         # Archivev15 Fix: Also skip opt-in preference fields (inline checkbox options)
         # PARITY FIX: Also skip witness signatures (they should not be matched against generic signature template)
         # These should not have templates applied to avoid breaking conditional relationships or changing keys
+        key = q.get("key", "")
         is_conditional_field = (
             bool(q.get("conditional_on")) or
-            "_explanation" in q.get("key", "") or
-            "_followup" in q.get("key", "") or
-            "_details" in q.get("key", "") or
-            q.get("key", "").startswith("opt_in_") or  # Archivev15: Skip opt-in preference fields
-            q.get("key", "") == "witness_signature" or  # PARITY FIX: Skip witness signatures
-            (q.get("title", "").lower().strip() in ["please explain", "explanation", "details", "comments"])
+            "_explanation" in key or
+            "_followup" in key or
+            "_details" in key or
+            key.startswith("opt_in_") or  # Archivev15: Skip opt-in preference fields
+            key == "witness_signature" or  # PARITY FIX: Skip witness signatures
+            (q.get("title", "").lower().strip() in CONDITIONAL_FIELD_TITLES)
         )
         
         if is_conditional_field:
             # Skip template matching for conditional fields
             out.append(q)
-            if dbg.enabled and not q.get("key", "").startswith("opt_in_"):
+            if dbg.enabled and not key.startswith("opt_in_"):
                 print(f"  [debug] template: skipping conditional field '{q.get('key')}' to preserve relationship")
             continue
         
@@ -14,6 +14,16 @@ DEFAULT_OUT_DIR = "JSONs"
 CHECKBOX_ANY = r"(?:\[\s*\]|\[x\]|☐|☑|□|■|❒|◻|✓|✔|✗|✘|!)"
 BULLET_RE = re.compile(r"^\s*(?:[-*•·]|" + CHECKBOX_ANY + r")\s+")
 CHECKBOX_MARK_RE = re.compile(r"^\s*(" + CHECKBOX_ANY + r")\s+")
+CHECKBOX_ANY_RE = re.compile(CHECKBOX_ANY)
+CHECKBOX_GLYPHS = "☐☑□■❒◻✓✔✗✘!"
+
+
+def has_checkbox_token(s: str) -> bool:
+    """Membership-only equivalent of re.search(CHECKBOX_ANY, s); only lines
+    containing "[" need the regex, the single-glyph tokens are plain str scans."""
+    if "[" in s:
+        return CHECKBOX_ANY_RE.search(s) is not None
+    return any(g in s for g in CHECKBOX_GLYPHS)
 
 INLINE_CHOICE_RE = re.compile(
     rf"(?:^|\s){CHECKBOX_ANY}\s*([^\[\]•·\-\u2022]+?)(?=(?:\s*{CHECKBOX_ANY}|\s*[•·\-]|$))"
@@ -104,7 +114,7 @@ PHONE_PATTERNS = [
     (r'(?:cell|mobile)\s+phone', 'cell_phone'),
 ]
 
-ALLOWED_TYPES = {"input", "date", "states", "radio", "dropdown", "terms", "signature"}
+ALLOWED_TYPES = frozenset({"input", "date", "states", "radio", "dropdown", "terms", "signature"})
 
 PRIMARY_SUFFIX = "__primary"
 SECONDARY_SUFFIX = "__secondary"
@@ -213,3 +223,6 @@ KNOWN_FIELD_LABELS = {
     'practice_name': r'\bpractice\s+name(?=[^a-zA-Z]|$)',
     'date_of_release': r'\bdate\s+of\s+release(?=[^a-zA-Z]|$)',
 }
+
+# All known field labels as one alternation, for "does any label occur" checks
+KNOWN_FIELD_LABEL_RE = re.compile("|".join(f"(?:{p})" for p in KNOWN_FIELD_LABELS.values()), re.I)
@@ -21,7 +21,7 @@ from typing import List, Optional, Dict, TYPE_CHECKING
 
 # Import from other modules
 from .text_preprocessing import collapse_spaced_caps, is_heading
-from .constants import CHECKBOX_ANY, CHECKBOX_MARK_RE
+from .constants import CHECKBOX_ANY, CHECKBOX_MARK_RE, has_checkbox_token
 from .question_parser import clean_option_text
 
 # Type hints for circular import - these are actually imported from core at runtime
@@ -77,7 +77,7 @@ def detect_table_layout(lines: List[str], start_idx: int, max_rows: int = 15) ->
     header_line = lines[start_idx].strip()
     
     # Don't treat as table if it has checkboxes (it's data, not a header)
-    if re.search(CHECKBOX_ANY, header_line):
+    if has_checkbox_token(header_line):
         return None
     
     # Split by significant spacing (5+ spaces) to find potential headers
@@ -210,7 +210,7 @@ def parse_table_to_questions(
                 segment = line[col_pos:]
             
             # Check if segment has a checkbox
-            if not re.search(CHECKBOX_ANY, segment):
+            if not has_checkbox_token(segment):
                 continue
             
             # Extract label (remove checkbox)
@@ -429,7 +429,7 @@ def detect_multicolumn_checkbox_grid(lines: List[str], start_idx: int, section:
             break
         
         # Skip category headers (lines without checkboxes that look like headers)
-        if not re.search(CHECKBOX_ANY, line):
+        if not has_checkbox_token(line):
             # Check if it's a category header (short, no colon, not a question)
             cleaned = collapse_spaced_caps(line.strip())
             if cleaned and len(cleaned.split()) <= 4 and not cleaned.endswith('?') and not cleaned.endswith(':'):
@@ -758,7 +758,7 @@ def parse_multicolumn_checkbox_grid(lines: List[str], grid_info: dict, debug: bo
                 potential_title = collapse_spaced_caps(lines[i].strip())
                 if debug:
                     print(f"    [debug] checking line {i} for title: '{potential_title[:60]}'")
-                if potential_title and not re.search(CHECKBOX_ANY, potential_title):
+                if potential_title and not has_checkbox_token(potential_title):
                     # Check if it looks like a section title (has "please mark" or similar)
                     if re.search(r'\b(please mark|indicate|select|check|do you have)\b', potential_title, re.I):
                         if len(potential_title) < 150:
@@ -860,7 +860,7 @@ def detect_medical_conditions_grid(lines: List[str], start_idx: int, debug: bool
         line = lines[i]
         line_stripped = line.strip()
         
-        if re.search(CHECKBOX_ANY, line):
+        if has_checkbox_token(line):
             checkbox_lines.append((i, line))
         elif line_stripped and not is_heading(line_stripped):
             # Check if this is still part of the grid or a new section
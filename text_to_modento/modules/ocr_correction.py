@@ -403,6 +403,70 @@ def get_correction_stats(text: str) -> Dict[str, int]:
     return stats
 
 
+# Dental-specific term corrections (applied case-insensitively)
+DENTAL_TERM_CORRECTIONS = {
+    # Procedures
+    r'\broot\s+can[a1]l\b': 'root canal',
+    r'\bc[a-z0]rn?\b': 'crown',
+    r'\bfill1ng\b': 'filling',
+    r'\bextr[a4]ction\b': 'extraction',
+    r'\bimp[l1]ant\b': 'implant',
+    r'\bdenture\b': 'denture',
+    r'\borthodontics?\b': 'orthodontics',
+    r'\bperiodont[a4]l\b': 'periodontal',
+    r'\bendodontic\b': 'endodontic',
+    
+    # Anatomical terms
+    r'\bte[e3]th?\b': 'teeth',
+    r'\btooth\b': 'tooth',
+    r'\bgums?\b': 'gums',
+    r'\bj[a4]w\b': 'jaw',
+    r'\bpal[a4]te\b': 'palate',
+    r'\btongue\b': 'tongue',
+    
+    # Conditions
+    r'\bcav[i1]ty\b': 'cavity',
+    r'\bdecay\b': 'decay',
+    r'\bgingivitis\b': 'gingivitis',
+    r'\bplaque\b': 'plaque',
+    r'\btart[a4]r\b': 'tartar',
+    r'\bbled1ng\b': 'bleeding',
+    r'\bs[e3]nsitiv[ei]ty\b': 'sensitivity',
+    r'\bp[a4]in\b': 'pain',
+    
+    # Medical terms
+    r'\ball[e3]rg[yi]c?\b': 'allergic',
+    r'\bm[e3]dicat[i1]ons?\b': 'medications',
+    r'\banesthet1c\b': 'anesthetic',
+    r'\banas?thesia\b': 'anesthesia',
+    r'\bdiab[e3]tes\b': 'diabetes',
+    r'\bhypert[e3]ns[i1]on\b': 'hypertension',
+    r'\bcard[i1]ovasc\w+\b': 'cardiovascular',
+    
+    # Form fields
+    r'\bph[o0]ne\b': 'phone',
+    r'\b[e3]ma[i1]l\b': 'email',
+    r'\baddr[e3]ss\b': 'address',
+    r'\bz[i1]pcode\b': 'zipcode',
+    r'\bs[i1]gnature\b': 'signature',
+    r'\bcons[e3]nt\b': 'consent',
+}
+
+# All dental term patterns fused into a single alternation so the text is
+# scanned once instead of once per pattern. The patterns match disjoint
+# whole words, so one pass gives the same result as applying them in turn.
+_DENTAL_TERM_REPLACEMENTS = tuple(DENTAL_TERM_CORRECTIONS.values())
+_DENTAL_TERM_RE = re.compile(
+    '|'.join(f'({pattern})' for pattern in DENTAL_TERM_CORRECTIONS),
+    re.IGNORECASE,
+)
+
+_PHONE_PAREN_RE = re.compile(r'\(\d{2}[OIl\d]\)\s*\d{2}[OIl\d]-\d{3}[OIl\d]')
+_PHONE_DASHED_RE = re.compile(r'\d{2}[OIl\d]-\d{2}[OIl\d]-\d{3}[OIl\d]')
+_DATE_LIKE_RE = re.compile(r'\d{1,2}[/I1]\d{1,2}[/I1]\d{2,4}')
+_DATE_SLASH_CONFUSION_RE = re.compile(r'[I1]\s*(?=\d{1,2}\s*[I1/]\s*\d)')
+
+
 def enhance_dental_term_corrections(text: str) -> str:
     """
     Improvement #2: Enhanced OCR correction with dental term dictionary.
@@ -416,60 +480,10 @@ def enhance_dental_term_corrections(text: str) -> str:
     Returns:
         Corrected text
     """
-    # Dental-specific term corrections
-    dental_corrections = {
-        # Procedures
-        r'\broot\s+can[a1]l\b': 'root canal',
-        r'\bc[a-z0]rn?\b': 'crown',
-        r'\bfill1ng\b': 'filling',
-        r'\bextr[a4]ction\b': 'extraction',
-        r'\bimp[l1]ant\b': 'implant',
-        r'\bdenture\b': 'denture',
-        r'\borthodontics?\b': 'orthodontics',
-        r'\bperiodont[a4]l\b': 'periodontal',
-        r'\bendodontic\b': 'endodontic',
-        
-        # Anatomical terms
-        r'\bte[e3]th?\b': 'teeth',
-        r'\btooth\b': 'tooth',
-        r'\bgums?\b': 'gums',
-        r'\bj[a4]w\b': 'jaw',
-        r'\bpal[a4]te\b': 'palate',
-        r'\btongue\b': 'tongue',
-        
-        # Conditions
-        r'\bcav[i1]ty\b': 'cavity',
-        r'\bdecay\b': 'decay',
-        r'\bgingivitis\b': 'gingivitis',
-        r'\bplaque\b': 'plaque',
-        r'\btart[a4]r\b': 'tartar',
-        r'\bbled1ng\b': 'bleeding',
-        r'\bs[e3]nsitiv[ei]ty\b': 'sensitivity',
-        r'\bp[a4]in\b': 'pain',
-        
-        # Medical terms
-        r'\ball[e3]rg[yi]c?\b': 'allergic',
-        r'\bm[e3]dicat[i1]ons?\b': 'medications',
-        r'\banesthet1c\b': 'anesthetic',
-        r'\banas?thesia\b': 'anesthesia',
-        r'\bdiab[e3]tes\b': 'diabetes',
-        r'\bhypert[e3]ns[i1]on\b': 'hypertension',
-        r'\bcard[i1]ovasc\w+\b': 'cardiovascular',
-        
-        # Form fields
-        r'\bph[o0]ne\b': 'phone',
-        r'\b[e3]ma[i1]l\b': 'email',
-        r'\baddr[e3]ss\b': 'address',
-        r'\bz[i1]pcode\b': 'zipcode',
-        r'\bs[i1]gnature\b': 'signature',
-        r'\bcons[e3]nt\b': 'consent',
-    }
-    
-    # Apply corrections (case-insensitive)
-    for pattern, replacement in dental_corrections.items():
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-    
-    return text
+    # Apply corrections (case-insensitive) in a single pass
+    return _DENTAL_TERM_RE.sub(
+        lambda m: _DENTAL_TERM_REPLACEMENTS[m.lastindex - 1], text
+    )
 
 
 def correct_phone_number_patterns(text: str) -> str:
@@ -497,8 +511,8 @@ def correct_phone_number_patterns(text: str) -> str:
         return phone
     
     # Match phone-like patterns and fix them
-    text = re.sub(r'\(\d{2}[OIl\d]\)\s*\d{2}[OIl\d]-\d{3}[OIl\d]', fix_phone_chars, text)
-    text = re.sub(r'\d{2}[OIl\d]-\d{2}[OIl\d]-\d{3}[OIl\d]', fix_phone_chars, text)
+    text = _PHONE_PAREN_RE.sub(fix_phone_chars, text)
+    text = _PHONE_DASHED_RE.sub(fix_phone_chars, text)
     
     return text
 
@@ -523,10 +537,10 @@ def correct_date_patterns(text: str) -> str:
         # Replace O with 0 in date context
         date = date.replace('O', '0').replace('o', '0')
         # Fix slash confusions
-        date = re.sub(r'[I1]\s*(?=\d{1,2}\s*[I1/]\s*\d)', '/', date)
+        date = _DATE_SLASH_CONFUSION_RE.sub('/', date)
         return date
     
     # Match date-like patterns
-    text = re.sub(r'\d{1,2}[/I1]\d{1,2}[/I1]\d{2,4}', fix_date_chars, text)
+    text = _DATE_LIKE_RE.sub(fix_date_chars, text)
     
     return text
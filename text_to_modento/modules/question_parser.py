@@ -13,7 +13,8 @@ field classification, and option generation.
 from __future__ import annotations
 
 import re
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 # Import from sibling modules
 from .text_preprocessing import collapse_spaced_caps
@@ -212,6 +213,7 @@ def infer_field_type_from_context(title: str, has_options: bool = False,
     return 'input'
 
 
+@lru_cache(maxsize=8192)
 def clean_field_title(title: str) -> str:
     """
     Clean field title by removing checkbox markers and artifacts (Fix 5).
@@ -279,6 +281,7 @@ def clean_token(s: str) -> str:
     return SPELL_FIX.get(s, s)
 
 
+@lru_cache(maxsize=8192)
 def normalize_opt_name(s: str) -> str:
     s = clean_token(s).lower()
     s = re.sub(r"[^\w\s]", "", s)
@@ -286,6 +289,7 @@ def normalize_opt_name(s: str) -> str:
     return s
 
 
+@lru_cache(maxsize=8192)
 def classify_input_type(label: str) -> Optional[str]:
     """
     Classify input type based on field label according to Modento schema.
@@ -351,6 +355,7 @@ def classify_date_input(label: str) -> str:
     return "past"
 
 
+@lru_cache(maxsize=8192)
 def slugify(s: str, maxlen: int = 64) -> str:
     """
     Convert a string to a valid key identifier with semantic truncation.
@@ -526,6 +531,18 @@ def make_option(name: str, bool_value: Optional[bool]) -> Dict:
     return {"name": name, "value": slugify(name, 80)}
 
 
+def make_yes_no_options() -> List[Dict]:
+    """
+    Build the standard Yes/No option pair.
+
+    Equivalent to [make_option("Yes", True), make_option("No", False)] without the
+    two calls. A fresh list of fresh dicts is returned because postprocessing edits
+    options in place.
+    """
+    return [{"name": "Yes", "value": True}, {"name": "No", "value": False}]
+
+
+@lru_cache(maxsize=8192)
 def norm_title(s: str) -> str:
     """
     Normalize title for comparison and grouping.
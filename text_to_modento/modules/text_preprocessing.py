@@ -11,15 +11,16 @@ This module contains functions for:
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Set
 from collections import Counter
 
 # Import constants from the constants module
 from .constants import (
-    CHECKBOX_ANY, BULLET_RE, PAGE_NUM_RE, ADDRESS_LIKE_RE,
+    CHECKBOX_ANY, BULLET_RE, PAGE_NUM_RE, has_checkbox_token, ADDRESS_LIKE_RE,
     DENTAL_PRACTICE_EMAIL_RE, BUSINESS_WITH_ADDRESS_RE,
-    PRACTICE_NAME_PATTERN, KNOWN_FIELD_LABELS
+    PRACTICE_NAME_PATTERN, KNOWN_FIELD_LABELS, KNOWN_FIELD_LABEL_RE
 )
 
 # Import OCR correction functions (Category 2 Fix 2.2)
@@ -30,6 +31,7 @@ from .ocr_correction import (
 )
 
 
+@lru_cache(maxsize=8192)
 def normalize_glyphs_line(s: str) -> str:
     """
     Normalize Unicode checkbox and bullet glyphs to ASCII representations.
@@ -54,6 +56,13 @@ def normalize_glyphs_line(s: str) -> str:
     return s
 
 
+# Patterns used by collapse_spaced_letters_any / collapse_spaced_caps
+_LETTER_RE = re.compile(r'[A-Za-z]')
+_SPACED_LETTERS_RE = re.compile(r"(?<!\w)(?:[A-Za-z]\s+){3,}[A-Za-z](?!\w)")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_SPACED_CAPS_RE = re.compile(r"(?:(?<=\b)|^)(?:[A-Z]\s+){2,}(?=[A-Z]\b)")
+
+
 def collapse_spaced_letters_any(s: str) -> str:
     """
     Collapse spaced-out letters while preserving word boundaries.
@@ -65,7 +74,7 @@ def collapse_spaced_letters_any(s: str) -> str:
     def collapse_match(match):
         text = match.group(0)
         # Find all letters with their positions
-        letters_with_pos = [(m.start(), m.group()) for m in re.finditer(r'[A-Za-z]', text)]
+        letters_with_pos = [(m.start(), m.group()) for m in _LETTER_RE.finditer(text)]
         
         if not letters_with_pos:
             return text
@@ -86,13 +95,14 @@ def collapse_spaced_letters_any(s: str) -> str:
         
         return ''.join(result)
     
-    s = re.sub(r"(?<!\w)(?:[A-Za-z]\s+){3,}[A-Za-z](?!\w)", collapse_match, s)
-    return re.sub(r"\s{2,}", " ", s).strip()
+    s = _SPACED_LETTERS_RE.sub(collapse_match, s)
+    return _MULTI_SPACE_RE.sub(" ", s).strip()
 
 
+@lru_cache(maxsize=8192)
 def collapse_spaced_caps(s: str) -> str:
     """Collapse spaced capital letters."""
-    s2 = re.sub(r"(?:(?<=\b)|^)(?:[A-Z]\s+){2,}(?=[A-Z]\b)", lambda m: m.group(0).replace(" ", ""), s)
+    s2 = _SPACED_CAPS_RE.sub(lambda m: m.group(0).replace(" ", ""), s)
     s2 = collapse_spaced_letters_any(s2)
     return s2.strip()
 
@@ -131,16 +141,27 @@ def is_heading(line: str, context: dict = None) -> bool:
             - 'original_line': Original line for spacing analysis
             - 'line_position': Position in document
     """
-    if context is None:
-        context = {}
-    
+    # The parser calls this repeatedly on the same lines (main loop plus look-ahead
+    # windows), so the context-free case is memoized
+    if not context:
+        return _is_heading_no_context(line)
+    return _is_heading_impl(line, context)
+
+
+@lru_cache(maxsize=8192)
+def _is_heading_no_context(line: str) -> bool:
+    return _is_heading_impl(line, {})
+
+
+def _is_heading_impl(line: str, context: dict) -> bool:
+    """Body of is_heading(); see its docstring."""
     t = collapse_spaced_caps(line.strip())
     if not t:
         return False
     
     # Archivev10 Fix 1: Don't treat lines with checkboxes as headings
     # Improvement 10: Use context if available
-    has_checkbox = context.get('has_checkbox', False) or re.search(CHECKBOX_ANY, t)
+    has_checkbox = context.get('has_checkbox', False) or has_checkbox_token(t)
     if has_checkbox:
         return False
     
@@ -192,9 +213,8 @@ def is_heading(line: str, context: dict = None) -> bool:
     # Archivev12 Fix: Don't treat known field labels as headings
     # Archivev13 Fix: Use search instead of match, and allow # suffix
     # Check against common form field patterns
-    for field_key, pattern in KNOWN_FIELD_LABELS.items():
-        if re.search(pattern, t, re.I):
-            return False
+    if KNOWN_FIELD_LABEL_RE.search(t):
+        return False
     
     # Archivev10 Fix 1: Don't treat multi-column grid headers as headings
     # (e.g., "Appearance    Function    Habits    Previous Comfort Options")
@@ -271,7 +291,7 @@ def is_category_header(line: str, next_line: str = "") -> bool:
         return False
     
     # Must NOT have checkboxes
-    if re.search(CHECKBOX_ANY, cleaned):
+    if has_checkbox_token(cleaned):
         return False
     
     # Must NOT be a question
@@ -317,11 +337,11 @@ def is_category_header(line: str, next_line: str = "") -> bool:
     is_known_category = any(kw in cleaned_lower for kw in category_keywords)
     
     # Archivev11 Fix 4: Label patterns with next line having checkboxes are headers
-    if is_label_pattern and next_line and re.search(CHECKBOX_ANY, next_line):
+    if is_label_pattern and next_line and has_checkbox_token(next_line):
         return True
     
     # Next line should have checkboxes (indicates this is a header for checkbox items)
-    if next_line and re.search(CHECKBOX_ANY, next_line):
+    if next_line and has_checkbox_token(next_line):
         # Check word count - category headers are usually 1-6 words (or multiple short phrases)
         # E.g., "Appearance Function Habits Previous Comfort Options" = 5 words but valid
         word_count = len(cleaned.split())
@@ -336,6 +356,7 @@ def is_category_header(line: str, next_line: str = "") -> bool:
     return False
 
 
+@lru_cache(maxsize=8192)
 def normalize_section_name(raw: str) -> str:
     """
     Normalize a section heading to a standard section name.
@@ -457,8 +478,10 @@ def scrub_headers_footers(text: str) -> List[str]:
         lines.extend(b); lines.append("")
 
     # Enhanced junk text filtering patterns (Fix 3)
+    # No leading '.*' on MULTI_LOCATION_RE: it is only used as a search() truth
+    # test, and the extra wildcard made each failed search cubic in line length.
     MULTI_LOCATION_RE = re.compile(
-        r'.*\b(Ave|Avenue|St|Street|Rd|Road|Blvd|Boulevard)\.?\b.*\b(Ave|Avenue|St|Street|Rd|Road|Blvd|Boulevard)\.?\b',
+        r'\b(Ave|Avenue|St|Street|Rd|Road|Blvd|Boulevard)\.?\b.*\b(Ave|Avenue|St|Street|Rd|Road|Blvd|Boulevard)\.?\b',
         re.I
     )
     CITY_STATE_ZIP_RE = re.compile(r',\s*[A-Z]{2}\s+\d{5}')
@@ -610,6 +633,7 @@ def coalesce_soft_wraps(lines: List[str]) -> List[str]:
     return out
 
 
+@lru_cache(maxsize=8192)
 def is_numbered_list_item(line: str) -> bool:
     """
     NEW Improvement 1: Detect if line is a numbered list item that should be part of Terms/consent.
@@ -759,6 +783,7 @@ def is_instructional_paragraph(line: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=8192)
 def is_form_metadata(line: str) -> bool:
     """
     NEW Improvement 6: Detect if line is form metadata that should be filtered out.